@@ -3,7 +3,9 @@ Base Agent class with communication capabilities
 All agents inherit from this base class
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+import queue
+import threading
 from .message_broker import MessageBroker, AgentMessage, get_broker, MessageType
 
 
@@ -15,6 +17,26 @@ class BaseAgent(ABC):
         self.broker: MessageBroker = get_broker()
         self.broker.subscribe(self.agent_id, self._handle_message)
         self.state: Dict[str, Any] = {}
+        # Outgoing (message, is_broadcast) pairs are delivered by a background
+        # worker so that process() does not wait on subscriber callbacks
+        self._mq: "queue.SimpleQueue[Tuple[AgentMessage, bool]]" = queue.SimpleQueue()
+        threading.Thread(
+            target=self._mq_worker,
+            name=f"{self.agent_id}-mq",
+            daemon=True
+        ).start()
+    
+    def _mq_worker(self):
+        """Drain the outgoing queue and deliver messages through the broker"""
+        while True:
+            message, is_broadcast = self._mq.get()
+            try:
+                if is_broadcast:
+                    self.broker.broadcast(message)
+                else:
+                    self.broker.publish(message)
+            except Exception as e:
+                print(f"[ERROR] Message delivery failed: {e}")
     
     def _handle_message(self, message: AgentMessage):
         """Default message handler - can be overridden"""
@@ -31,24 +53,24 @@ class BaseAgent(ABC):
         content: Dict[str, Any],
         target_agents: List[str]
     ):
-        """Send a message to other agents"""
+        """Send a message to other agents (fire-and-forget)"""
         message = self.broker.create_message(
             agent_id=self.agent_id,
             message_type=message_type,
             content=content,
             target_agents=target_agents
         )
-        self.broker.publish(message)
+        self._mq.put((message, False))
     
     def broadcast(self, message_type: str, content: Dict[str, Any]):
-        """Broadcast message to all agents"""
+        """Broadcast message to all agents (fire-and-forget)"""
         message = self.broker.create_message(
             agent_id=self.agent_id,
             message_type=message_type,
             content=content,
             target_agents=["*"]
         )
-        self.broker.broadcast(message)
+        self._mq.put((message, True))
     
     @abstractmethod
     def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,86 @@
+"""
+Keyword Matcher
+Multi-pattern keyword search shared by the text analysis agents
+"""
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Mapping, Sequence, Set
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Toplu taramada metinleri ayıran karakter (anahtar kelimelerde bulunmaz)
+_BATCH_SEPARATOR = "\x00"
+
+
+class KeywordMatcher:
+    """
+    Finds which keywords occur in a text, grouped by tag.
+    Uses a single Aho-Corasick pass when pyahocorasick is installed,
+    otherwise falls back to one substring check per keyword.
+    """
+
+    def __init__(self, keywords_by_tag: Mapping[str, Iterable[str]]):
+        self.keywords_by_tag: Dict[str, tuple] = {
+            tag: tuple(keywords) for tag, keywords in keywords_by_tag.items()
+        }
+        self._automaton = None
+
+        if AHOCORASICK_AVAILABLE and any(self.keywords_by_tag.values()):
+            automaton = ahocorasick.Automaton()
+            for tag, keywords in self.keywords_by_tag.items():
+                for keyword in keywords:
+                    # Aynı kelime birden fazla tag altında olabilir
+                    _, tags = automaton.get(keyword, (keyword, ()))
+                    if tag not in tags:
+                        automaton.add_word(keyword, (keyword, tags + (tag,)))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def match(self, text: str) -> Dict[str, Set[str]]:
+        """Matched keywords per tag (each keyword reported once)"""
+        found: Dict[str, Set[str]] = {tag: set() for tag in self.keywords_by_tag}
+        if not text:
+            return found
+
+        if self._automaton is not None:
+            for _, (keyword, tags) in self._automaton.iter(text):
+                for tag in tags:
+                    found[tag].add(keyword)
+        else:
+            for tag, keywords in self.keywords_by_tag.items():
+                found[tag] = {keyword for keyword in keywords if keyword in text}
+
+        return found
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of distinct keywords found per tag"""
+        return {tag: len(keywords) for tag, keywords in self.match(text).items()}
+
+    def count_many(self, texts: Sequence[str]) -> List[Dict[str, int]]:
+        """
+        count() for a batch of texts.
+        With the automaton the whole batch is scanned in one pass over the
+        texts joined by a separator that no keyword contains.
+        """
+        if self._automaton is None:
+            return [self.count(text) for text in texts]
+
+        found: List[Dict[str, Set[str]]] = [
+            {tag: set() for tag in self.keywords_by_tag} for _ in texts
+        ]
+        # Her metnin birleşik dizgedeki bitiş ofseti
+        ends: List[int] = []
+        offset = -1
+        for text in texts:
+            offset += len(text) + 1
+            ends.append(offset)
+
+        for end_index, (keyword, tags) in self._automaton.iter(_BATCH_SEPARATOR.join(texts)):
+            matched = found[bisect_left(ends, end_index)]
+            for tag in tags:
+                matched[tag].add(keyword)
+
+        return [{tag: len(keywords) for tag, keywords in item.items()} for item in found]
@@ -4,6 +4,7 @@ Görev: Sistem öğrenmesi
 """
 from typing import Dict, Any, List, Optional, Tuple
 from .base_agent import BaseAgent
+from array import array
 import random
 
 
@@ -13,11 +14,18 @@ class ReinforcementAgent(BaseAgent):
     Deep Q-Learning, Policy Gradient için hazır
     """
     
+    # 0.1 çözünürlükte 11x11 olası state key'i (önceden hesaplanmış)
+    _STATE_KEY_TABLE = tuple(
+        f"conf_{c / 10:.1f}_cred_{r / 10:.1f}"
+        for c in range(11) for r in range(11)
+    )
+    
     def __init__(self):
         super().__init__("RLA")
         self.q_table: Dict[str, Dict[str, float]] = {}
         self.action_history: List[Dict[str, Any]] = []
-        self.reward_history: List[float] = []
+        # Reward'lar [-1.5, 1.5] aralığında; float32 buffer yeterli
+        self.reward_history: array = array("f")
         self.learning_rate = 0.1
         self.discount_factor = 0.95
         self.epsilon = 0.1  # Exploration rate
@@ -177,7 +185,7 @@ class ReinforcementAgent(BaseAgent):
         if processing_time < 30.0:  # 30 saniyeden az
             reward += 0.1
         
-        return reward
+        return float(reward)
     
     def get_policy(self) -> Dict[str, Dict[str, float]]:
         """Mevcut policy'yi döndür"""
@@ -194,7 +202,7 @@ class ReinforcementAgent(BaseAgent):
         # Positive indicators (system was correct)
         positive_words = [
             "doğru", "haklı", "başarılı", "iyi", "güzel", "mükemmel",
-            "kesinlikle", "tam", "uygun", "uygun", "doğru tespit",
+            "kesinlikle", "tam", "uygun", "doğru tespit",
             "correct", "right", "accurate", "good", "excellent"
         ]
         
@@ -227,10 +235,14 @@ class ReinforcementAgent(BaseAgent):
         source_cred = state.get("source_credibility", 0.5)
         
         # Discretize
-        conf_bin = int(confidence * 10) / 10
-        cred_bin = int(source_cred * 10) / 10
+        conf_idx = int(confidence * 10)
+        cred_idx = int(source_cred * 10)
+        
+        if 0 <= conf_idx <= 10 and 0 <= cred_idx <= 10:
+            return self._STATE_KEY_TABLE[conf_idx * 11 + cred_idx]
         
-        return f"conf_{conf_bin:.1f}_cred_{cred_bin:.1f}"
+        # Aralık dışı değerler için eski formatlama
+        return f"conf_{conf_idx / 10:.1f}_cred_{cred_idx / 10:.1f}"
     
     def get_average_reward(self, window: int = 100) -> float:
         """Son N reward'un ortalaması"""
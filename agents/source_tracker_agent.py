@@ -2,7 +2,7 @@
 Source Tracker Agent (STA)
 Görev: Kaynak analizi ve takibi
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from urllib.parse import urlparse
 from .base_agent import BaseAgent
@@ -22,9 +22,7 @@ class SourceTrackerAgent(BaseAgent):
     
     def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Ana işleme metodu"""
-        source_info = self.analyze_source(data)
-        timeline_entry = self.track_publication(data)
-        relationships = self.map_relationships(data)
+        source_info, timeline_entry, relationships = self._analyze_track_map(data)
         
         result = {
             "source_info": source_info,
@@ -49,41 +47,75 @@ class SourceTrackerAgent(BaseAgent):
         """Kaynak analizi"""
         link = item.get("link") or item.get("id", "")
         domain = self._extract_domain(link)
+        return self._build_source_info(
+            link, domain, self._classify_source_type(domain), datetime.utcnow().isoformat()
+        )
+    
+    def track_publication(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Yayın zaman çizelgesi takibi"""
+        domain = self._extract_domain(item.get("link", ""))
+        return self._record_publication(item, domain, datetime.utcnow().isoformat())
+    
+    def map_relationships(self, item: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Kaynak ilişkilerini haritalama"""
+        domain = self._extract_domain(item.get("link", ""))
+        return self._record_relationships(domain, self._classify_source_type(domain))
+    
+    def _analyze_track_map(self, item: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, List[str]]]:
+        """
+        analyze_source + track_publication + map_relationships tek geçişte:
+        domain, kaynak tipi ve zaman damgası bir kez hesaplanır
+        """
+        link = item.get("link", "")
+        domain = self._extract_domain(link)
+        source_type = self._classify_source_type(domain)
+        timestamp = datetime.utcnow().isoformat()
         
+        # analyze_source link yoksa id'ye düşer
+        source_url = link or item.get("id", "")
+        if source_url == link:
+            source_domain, source_domain_type = domain, source_type
+        else:
+            source_domain = self._extract_domain(source_url)
+            source_domain_type = self._classify_source_type(source_domain)
+        
+        return (
+            self._build_source_info(source_url, source_domain, source_domain_type, timestamp),
+            self._record_publication(item, domain, timestamp),
+            self._record_relationships(domain, source_type)
+        )
+    
+    def _build_source_info(self, url: str, domain: str, source_type: str, timestamp: str) -> Dict[str, Any]:
+        """Kaynak analizi sonucunu oluştur"""
         # Kaynak güvenilirlik skoru (0-1)
         credibility = self._get_credibility_score(domain)
         
-        # Kaynak tipi tespiti
-        source_type = self._classify_source_type(domain)
-        
         return {
             "domain": domain,
-            "url": link,
+            "url": url,
             "credibility_score": credibility,
             "source_type": source_type,
             "is_verified": credibility > 0.7,
-            "analysis_timestamp": datetime.utcnow().isoformat()
+            "analysis_timestamp": timestamp
         }
     
-    def track_publication(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """Yayın zaman çizelgesi takibi"""
+    def _record_publication(self, item: Dict[str, Any], domain: str, timestamp: str) -> Dict[str, Any]:
+        """Zaman çizelgesine kayıt ekle"""
         entry = {
             "id": item.get("id", ""),
-            "domain": self._extract_domain(item.get("link", "")),
+            "domain": domain,
             "headline": item.get("headline", ""),
-            "timestamp": datetime.utcnow().isoformat(),
-            "first_seen": datetime.utcnow().isoformat()
+            "timestamp": timestamp,
+            "first_seen": timestamp
         }
         
         self.publication_timeline.append(entry)
         return entry
     
-    def map_relationships(self, item: Dict[str, Any]) -> Dict[str, List[str]]:
-        """Kaynak ilişkilerini haritalama"""
-        domain = self._extract_domain(item.get("link", ""))
-        
+    def _record_relationships(self, domain: str, source_type: str) -> Dict[str, List[str]]:
+        """İlişkili kaynakları bul ve kaydet"""
         # Benzer kaynakları bul (basit implementasyon)
-        related_sources = self._find_related_sources(domain)
+        related_sources = self._find_related_sources(domain, source_type)
         
         if domain not in self.source_relationships:
             self.source_relationships[domain] = []
@@ -201,14 +233,16 @@ class SourceTrackerAgent(BaseAgent):
         else:
             return "unknown"
     
-    def _find_related_sources(self, domain: str) -> List[str]:
+    def _find_related_sources(self, domain: str, source_type: Optional[str] = None) -> List[str]:
         """İlişkili kaynakları bul"""
         # Basit implementasyon - gerçek uygulamada graph database kullanılır
+        if source_type is None:
+            source_type = self._classify_source_type(domain)
         related = []
         for other_domain in self.source_relationships.keys():
             if other_domain != domain:
                 # Aynı kategorideki kaynaklar
-                if self._classify_source_type(domain) == self._classify_source_type(other_domain):
+                if source_type == self._classify_source_type(other_domain):
                     related.append(other_domain)
         return related[:5]  # En fazla 5 ilişkili kaynak
 
@@ -3,9 +3,9 @@ Twitter/X Crawler Agent
 Fetches tweets from X (Twitter) platform for fake news detection
 """
 import os
+import re
 import time
 from typing import Dict, Any, Optional, List
-from datetime import datetime
 
 try:
     import tweepy
@@ -14,6 +14,15 @@ except ImportError:
     TWEEPY_AVAILABLE = False
 
 
+_RT_RE = re.compile(r'^RT\s+@\w+:\s+')
+_URL_RE = re.compile(r'http\S+|www\.\S+')
+
+_TWEET_FIELDS = ["created_at", "author_id", "public_metrics", "text", "entities"]
+
+# Toplu tweet sorgusunda istek başına en fazla ID (API limiti)
+_LOOKUP_BATCH_SIZE = 100
+
+
 class TwitterCrawlerAgent:
     """
     Twitter/X Crawler Agent
@@ -22,6 +31,8 @@ class TwitterCrawlerAgent:
     
     def __init__(self):
         self.client = None
+        # username -> user_id (get_user her seferinde çağrılmasın)
+        self._user_id_cache: Dict[str, Any] = {}
         self._initialize_client()
     
     def _initialize_client(self):
@@ -53,6 +64,12 @@ class TwitterCrawlerAgent:
                 "Twitter API credentials not found. "
                 "Set TWITTER_BEARER_TOKEN or TWITTER_API_KEY/API_SECRET/ACCESS_TOKEN/ACCESS_TOKEN_SECRET"
             )
+        
+        # Converter is bound once per client type instead of probing each tweet
+        if isinstance(self.client, tweepy.Client):
+            self._converter = self._v2_to_news_item
+        else:
+            self._converter = self._v1_to_news_item
     
     def fetch_news(
         self,
@@ -111,35 +128,75 @@ class TwitterCrawlerAgent:
         except Exception as e:
             raise RuntimeError(f"Twitter API error: {str(e)}")
     
+    def fetch_many(self, tweet_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch many tweets by ID with batched lookups (100 IDs per request)
+        
+        Args:
+            tweet_ids: Tweet IDs to fetch
+        
+        Returns:
+            List of news items; deleted or inaccessible tweets are skipped
+        """
+        if not self.client:
+            raise RuntimeError("Twitter client not initialized")
+        
+        items = []
+        try:
+            for start in range(0, len(tweet_ids), _LOOKUP_BATCH_SIZE):
+                chunk = tweet_ids[start:start + _LOOKUP_BATCH_SIZE]
+                for tweet in self._fetch_tweets_by_ids(chunk):
+                    items.append(self._tweet_to_news_item(tweet))
+        except tweepy.TooManyRequests:
+            raise RuntimeError("Twitter API rate limit exceeded. Please wait and try again.")
+        except tweepy.Unauthorized:
+            raise RuntimeError("Twitter API authentication failed. Check your credentials.")
+        except Exception as e:
+            raise RuntimeError(f"Twitter API error: {str(e)}")
+        
+        return items
+    
     def _fetch_tweet_by_id(self, tweet_id: str) -> Any:
         """Fetch a specific tweet by ID"""
         if isinstance(self.client, tweepy.Client):
             # Twitter API v2
             tweet = self.client.get_tweet(
                 tweet_id,
-                tweet_fields=["created_at", "author_id", "public_metrics", "text", "entities"]
+                tweet_fields=_TWEET_FIELDS
             )
             return tweet.data
         else:
             # Twitter API v1.1
             return self.client.get_status(tweet_id, tweet_mode="extended")
     
+    def _fetch_tweets_by_ids(self, tweet_ids: List[str]) -> List[Any]:
+        """Fetch up to 100 tweets in a single lookup request"""
+        if isinstance(self.client, tweepy.Client):
+            # Twitter API v2
+            tweets = self.client.get_tweets(ids=tweet_ids, tweet_fields=_TWEET_FIELDS)
+            return tweets.data if tweets.data else []
+        else:
+            # Twitter API v1.1
+            return self.client.lookup_statuses(tweet_ids, tweet_mode="extended")
+    
     def _fetch_user_tweets(self, username: str, max_results: int = 10) -> List[Any]:
         """Fetch user's latest tweets"""
         if isinstance(self.client, tweepy.Client):
             # Twitter API v2
-            # First get user ID
-            user = self.client.get_user(username=username)
-            if not user.data:
-                raise ValueError(f"User not found: {username}")
-            
-            user_id = user.data.id
+            # First get user ID (cached per username)
+            user_id = self._user_id_cache.get(username)
+            if user_id is None:
+                user = self.client.get_user(username=username)
+                if not user.data:
+                    raise ValueError(f"User not found: {username}")
+                user_id = user.data.id
+                self._user_id_cache[username] = user_id
             
             # Fetch tweets
             tweets = self.client.get_users_tweets(
                 user_id,
                 max_results=min(max_results, 100),  # API limit
-                tweet_fields=["created_at", "author_id", "public_metrics", "text", "entities"]
+                tweet_fields=_TWEET_FIELDS
             )
             return tweets.data if tweets.data else []
         else:
@@ -158,7 +215,7 @@ class TwitterCrawlerAgent:
             tweets = self.client.search_recent_tweets(
                 query=query,
                 max_results=min(max_results, 100),  # API limit
-                tweet_fields=["created_at", "author_id", "public_metrics", "text", "entities"]
+                tweet_fields=_TWEET_FIELDS
             )
             return tweets.data if tweets.data else []
         else:
@@ -172,42 +229,60 @@ class TwitterCrawlerAgent:
     
     def _tweet_to_news_item(self, tweet: Any) -> Dict[str, Any]:
         """Convert tweet object to news item format"""
-        if isinstance(self.client, tweepy.Client):
-            # Twitter API v2 format
-            text = tweet.text if hasattr(tweet, 'text') else str(tweet)
-            tweet_id = tweet.id if hasattr(tweet, 'id') else str(tweet)
-            created_at = tweet.created_at if hasattr(tweet, 'created_at') else datetime.utcnow()
-            author_id = tweet.author_id if hasattr(tweet, 'author_id') else None
-            
-            # Build URL
-            link = f"https://twitter.com/i/web/status/{tweet_id}"
-            
-            # Extract media if available
-            image_url = None
-            if hasattr(tweet, 'entities') and tweet.entities:
-                if 'media' in tweet.entities:
-                    media = tweet.entities['media']
-                    if media and len(media) > 0:
-                        image_url = media[0].get('media_url_https') if isinstance(media[0], dict) else None
-            
-        else:
-            # Twitter API v1.1 format
-            text = tweet.full_text if hasattr(tweet, 'full_text') else tweet.text
-            tweet_id = tweet.id_str
-            created_at = tweet.created_at
-            author_id = tweet.user.id_str if hasattr(tweet, 'user') else None
-            
-            # Build URL
-            username = tweet.user.screen_name if hasattr(tweet, 'user') else "unknown"
-            link = f"https://twitter.com/{username}/status/{tweet_id}"
-            
-            # Extract media
-            image_url = None
-            if hasattr(tweet, 'entities') and 'media' in tweet.entities:
-                media = tweet.entities['media']
-                if media and len(media) > 0:
-                    image_url = media[0].get('media_url_https')
+        return self._converter(tweet)
+    
+    def _v2_to_news_item(self, tweet: Any) -> Dict[str, Any]:
+        """Convert a Twitter API v2 tweet to news item format"""
+        tweet_id = tweet.id
+        
+        # Extract media if available
+        image_url = None
+        entities = tweet.entities
+        if entities and 'media' in entities:
+            media = entities['media']
+            if media and isinstance(media[0], dict):
+                image_url = media[0].get('media_url_https')
+        
+        return self._build_news_item(
+            text=tweet.text,
+            tweet_id=tweet_id,
+            link=f"https://twitter.com/i/web/status/{tweet_id}",
+            author_id=tweet.author_id,
+            created_at=tweet.created_at,
+            image_url=image_url
+        )
+    
+    def _v1_to_news_item(self, tweet: Any) -> Dict[str, Any]:
+        """Convert a Twitter API v1.1 status to news item format"""
+        tweet_id = tweet.id_str
+        user = getattr(tweet, 'user', None)
+        username = user.screen_name if user else "unknown"
         
+        # Extract media
+        image_url = None
+        media = tweet.entities.get('media')
+        if media:
+            image_url = media[0].get('media_url_https')
+        
+        return self._build_news_item(
+            text=getattr(tweet, 'full_text', None) or tweet.text,
+            tweet_id=tweet_id,
+            link=f"https://twitter.com/{username}/status/{tweet_id}",
+            author_id=user.id_str if user else None,
+            created_at=tweet.created_at,
+            image_url=image_url
+        )
+    
+    def _build_news_item(
+        self,
+        text: str,
+        tweet_id: Any,
+        link: str,
+        author_id: Any,
+        created_at: Any,
+        image_url: Optional[str]
+    ) -> Dict[str, Any]:
+        """Common news item layout for both API versions"""
         # Clean text (remove URLs, mentions, etc.)
         cleaned_text = self._clean_tweet_text(text)
         
@@ -228,18 +303,15 @@ class TwitterCrawlerAgent:
     
     def _clean_tweet_text(self, text: str) -> str:
         """Clean tweet text - remove URLs, RT prefixes, etc."""
-        import re
-        
         # Remove RT prefix
-        text = re.sub(r'^RT\s+@\w+:\s+', '', text)
+        text = _RT_RE.sub('', text)
         
         # Remove URLs
-        text = re.sub(r'http\S+|www\.\S+', '', text)
-        
-        # Remove extra whitespace
-        text = ' '.join(text.split())
+        text = _URL_RE.sub('', text)
         
-        return text.strip()
+        # Remove extra whitespace (split/join is faster than a \s+ regex in
+        # CPython and never leaves leading/trailing spaces, so no strip())
+        return ' '.join(text.split())
 
 
 
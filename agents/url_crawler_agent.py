@@ -1,15 +1,65 @@
 # agents/url_crawler_agent.py
+import asyncio
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+import json
+import multiprocessing
+import random
+import re
 import time
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
-from bs4 import BeautifulSoup
+import zlib
+from html import unescape
+from typing import Dict, List, Optional
+from urllib.error import HTTPError
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+import urllib3
 import sys
 import os
 
+# BeautifulSoup için C tabanlı lxml parser'ı, yoksa html.parser
+try:
+    BeautifulSoup("", "lxml")
+    BS4_PARSER = "lxml"
+except FeatureNotFound:
+    BS4_PARSER = "html.parser"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import trafilatura
+    TRAFILATURA_AVAILABLE = True
+except ImportError:
+    TRAFILATURA_AVAILABLE = False
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# HTTP/2 için h2 paketi gerekir; yoksa HTTP/1.1 keep-alive kullanılır
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 # Add parent directory to path for fact_check_detector
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
-    from fact_check_detector import FactCheckDetector
+    from fact_check_detector import get_fact_check_detector
     FACT_CHECK_AVAILABLE = True
 except ImportError:
     FACT_CHECK_AVAILABLE = False
@@ -18,50 +68,596 @@ DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
-    "Connection": "close",
+    # br yalnızca açabileceğimiz zaman istenir (httpx de aynı brotli paketini kullanır)
+    "Accept-Encoding": "gzip, br" if BROTLI_AVAILABLE else "gzip",
 }
 
-def _download(url: str, headers: dict | None = None, timeout: int = 20, retries: int = 3, backoff: float = 1.5) -> bytes:
+# r.jina.ai text-only fallback isteklerinin başlıkları (modül yüklenirken bir kez)
+_FALLBACK_HEADERS = {**DEFAULT_HEADERS, "Accept": "text/plain"}
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Sayfanın ilk 512 KB'ı yeterli (metin zaten 8000 karaktere kırpılıyor)
+MAX_RESPONSE_BYTES = 524288
+READ_CHUNK_SIZE = 65536
+
+# Kalıcı bağlantı havuzu: aynı host'a giden isteklerde TCP/TLS bağlantısı
+# yeniden kullanılır (keep-alive, "Connection: close" gönderilmez). Havuz
+# tüm ajan örnekleri arasında paylaşılır; host başına 32 bağlantı, API'nin
+# eşzamanlı fetch_news çağrılarında bağlantı atılıp yeniden açılmasını önler.
+# Yeniden deneme politikası istek başına _retry_policy ile verilir.
+_POOL = urllib3.PoolManager(num_pools=32, maxsize=32)
+
+# Yeniden denemeler arası bekleme: üstel artar, bu süreyle sınırlı ve tam jitter'lı
+# (aynı host'a giden batch istekleri aynı anda yeniden denemesin)
+BACKOFF_MAX_SECONDS = 60
+# Sunucunun Retry-After ile istediği bekleme bu süreyle sınırlanır (istek
+# timeout'u bu beklemeyi kapsamaz; sınırsız Retry-After worker thread'ini tutar)
+RETRY_AFTER_MAX_SECONDS = 5
+
+def _backoff_delay(attempt: int, backoff: float) -> float:
+    """attempt. (0'dan) başarısız denemeden sonraki bekleme süresi"""
+    return random.random() * min(BACKOFF_MAX_SECONDS, backoff * (2 ** attempt))
+
+class _JitterRetry(urllib3.Retry):
+    """
+    urllib3 Retry; Retry-After yoksa bekleme _backoff_delay ile hesaplanır,
+    Retry-After RETRY_AFTER_MAX_SECONDS ile sınırlanır. failures: hata
+    türünden bağımsız toplam yeniden deneme hakkı (yönlendirmeler sayılmaz)
+    """
+    def __init__(self, *args, failures: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failures = failures
+
+    def new(self, **kw) -> "_JitterRetry":
+        kw.setdefault("failures", self.failures)
+        return super().new(**kw)
+
+    def is_exhausted(self) -> bool:
+        if super().is_exhausted():
+            return True
+        if self.failures is None:
+            return False
+        failed = sum(1 for entry in self.history if entry.redirect_location is None)
+        return failed > self.failures
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX_SECONDS)
+
+    def get_backoff_time(self) -> float:
+        # Yönlendirmeler hariç art arda gelen hatalar
+        failures = 0
+        for entry in reversed(self.history):
+            if entry.redirect_location is not None:
+                break
+            failures += 1
+        return _backoff_delay(failures - 1, self.backoff_factor) if failures else 0.0
+
+def _retry_policy(retries: int, backoff: float) -> urllib3.Retry:
+    """
+    _download'ın deneme kuralları urllib3 Retry olarak: bağlantı/okuma hatası
+    ve RETRY_STATUS_CODES birlikte toplam `retries` deneme (yönlendirmeler
+    ayrı sayılır), 429/503'te Retry-After'a (en fazla RETRY_AFTER_MAX_SECONDS)
+    uyulur. Denemeler tükenince son yanıt döner (HTTPError'ı çağıran yükseltir).
+    """
+    attempts = max(retries - 1, 0)
+    return _JitterRetry(
+        failures=attempts,
+        total=None,  # yönlendirmeler deneme hakkından düşmesin
+        connect=attempts,
+        read=attempts,
+        status=attempts,
+        other=0,
+        redirect=10,
+        status_forcelist=RETRY_STATUS_CODES,
+        backoff_factor=backoff,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+# Sayfa önbelleği (ETag/Last-Modified ile koşullu istek)
+CRAWL_CACHE_DIR = "logs/crawl_cache"
+CRAWL_CACHE_SIZE_LIMIT = 2 ** 30
+# Bu süre içinde (saniye) önbellekteki sonuç ağa gitmeden döner
+CRAWL_CACHE_FRESH_SECONDS = 3600
+# Doğrulayıcısı olan kayıtlar bu süre boyunca koşullu istekle yenilenir
+CRAWL_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# fetch_news_many: paylaşılan async client'ın bağlantı havuzu
+MAX_KEEPALIVE_CONNECTIONS = 64
+MAX_CONNECTIONS = 100
+
+# fetch_news_many: bu kadar URL'den itibaren HTML ayrıştırma process havuzunda yapılır
+PARSE_POOL_MIN_BATCH = 16
+
+# Content-Type başlığındaki ve sayfa başındaki <meta charset> bildirimi
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_SCAN_BYTES = 2048
+
+def _response_charset(headers: dict) -> str | None:
+    """Yanıt başlıklarından karakter kodlaması (yoksa None)"""
+    content_type = headers.get("Content-Type") or headers.get("content-type") or ""
+    match = _CHARSET_RE.search(content_type)
+    return match.group(1) if match else None
+
+def _decode_html(html_bytes: bytes, charset: str | None = None) -> str:
+    """Sayfayı bildirilen kodlamayla tek seferde çöz (başlık > <meta charset> > utf-8)"""
+    if not charset:
+        match = _META_CHARSET_RE.search(html_bytes, 0, _META_CHARSET_SCAN_BYTES)
+        charset = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        return html_bytes.decode(charset, errors="replace")
+    except LookupError:
+        return html_bytes.decode("utf-8", errors="replace")
+
+def _body_decoder(content_encoding: str):
+    """
+    Content-Encoding için akış açıcı: (ham parça, kalan bayt) -> açılmış parça.
+    Kodlama yoksa (veya açılamıyorsa) None.
+    """
+    encoding = content_encoding.lower()
+    if encoding == "gzip":
+        return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+    if encoding == "br" and BROTLI_AVAILABLE:
+        decompressor = brotli.Decompressor()
+        return lambda raw, limit: decompressor.process(raw)[:limit]
+    return None
+
+def _read_capped(resp, max_bytes: int) -> bytes:
+    """
+    Yanıtı parça parça, gövde max_bytes'a ulaşana kadar oku. gzip/br gövdeler
+    geldikçe açılır; açılmış metin sınıra ulaşınca okumayı bırakır.
+    """
+    decompressor = _body_decoder(resp.headers.get("Content-Encoding", ""))
+    chunks = []
+    size = 0
+    while size < max_bytes:
+        if decompressor is None:
+            chunk = resp.read(min(READ_CHUNK_SIZE, max_bytes - size))
+            if not chunk:
+                break
+        else:
+            raw = resp.read(READ_CHUNK_SIZE)
+            if not raw:
+                break
+            chunk = decompressor(raw, max_bytes - size)
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks)
+
+def _download(url: str, headers: dict | None = None, timeout: int = 20, retries: int = 3, backoff: float = 1.5, max_bytes: int = MAX_RESPONSE_BYTES) -> bytes:
     """Retry’li indirici: 429 ve 5xx’te yeniden dener, diğer 4xx’te doğrudan hatayı yükseltir."""
+    return _download_response(url, headers, timeout, retries, backoff, max_bytes)[0]
+
+def _download_response(url: str, headers: dict | None = None, timeout: int = 20, retries: int = 3, backoff: float = 1.5, max_bytes: int = MAX_RESPONSE_BYTES) -> tuple[bytes, dict]:
+    """_download gibi, ama gövdeyle birlikte yanıt başlıklarını da döndürür."""
+    # Ek başlık yoksa (en sık durum) varsayılan sözlük kopyalanmadan kullanılır
+    hdrs = DEFAULT_HEADERS if not headers else {**DEFAULT_HEADERS, **headers}
+    # Bağlantı hataları denemeler tükenince MaxRetryError olarak yükselir
+    resp = _POOL.request(
+        "GET", url,
+        headers=hdrs,
+        timeout=timeout,
+        retries=_retry_policy(retries, backoff),
+        preload_content=False,
+        decode_content=False  # gzip/br _read_capped içinde açılır
+    )
+    try:
+        if resp.status >= 300:
+            # urllib ile aynı hata tipi (çağıranlar e.code'a bakıyor)
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return _read_capped(resp, max_bytes), dict(resp.headers)
+    finally:
+        # Okunmamış gövde kalırsa havuz bağlantıyı düşmüş sayıp yeniler
+        resp.release_conn()
+
+async def _download_async(client: "httpx.AsyncClient", url: str, headers: dict | None = None, timeout: int = 20, retries: int = 3, backoff: float = 1.5, max_bytes: int = MAX_RESPONSE_BYTES) -> tuple[bytes, dict]:
+    """_download_response'un async karşılığı: aynı retry/backoff kuralları, paylaşılan client bağlantıları."""
     last_err = None
-    hdrs = {**DEFAULT_HEADERS, **(headers or {})}
     for attempt in range(retries):
+        delay = None
         try:
-            req = Request(url, headers=hdrs)
-            with urlopen(req, timeout=timeout) as resp:
-                return resp.read()
-        except HTTPError as e:
-            if e.code in (429, 500, 502, 503, 504):
-                last_err = e
-                time.sleep(backoff * (attempt + 1))
-                continue
-            raise
-        except URLError as e:
+            async with client.stream("GET", url, headers=headers, timeout=timeout) as resp:
+                resp.raise_for_status()
+                # aiter_bytes gzip/br'yi kendisi açar
+                chunks = []
+                size = 0
+                async for chunk in resp.aiter_bytes(READ_CHUNK_SIZE):
+                    chunks.append(chunk[:max_bytes - size])
+                    size += len(chunks[-1])
+                    if size >= max_bytes:
+                        break
+                return b"".join(chunks), dict(resp.headers)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in RETRY_STATUS_CODES:
+                raise
             last_err = e
-            time.sleep(backoff * (attempt + 1))
-            continue
+            # Sunucu bekleme süresi bildirdiyse (429/503) ona uy
+            retry_after = e.response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = min(int(retry_after), RETRY_AFTER_MAX_SECONDS)
         except Exception as e:
             last_err = e
-            time.sleep(backoff * (attempt + 1))
-            continue
+        if attempt + 1 < retries:
+            await asyncio.sleep(_backoff_delay(attempt, backoff) if delay is None else delay)
     if last_err:
         raise last_err
     raise RuntimeError(f"Failed to download {url} for unknown reasons.")
 
+def _fallback_url(url: str) -> str:
+    """Text-only fallback adresi (JS/anti-bot kaynaklı 500/429 için)"""
+    # Yalnızca baştaki şema atılır; sorgu içindeki gömülü URL'ler korunur
+    stripped = url.removeprefix("https://").removeprefix("http://")
+    return f"https://r.jina.ai/http://{stripped}"
+
+# Haber metni bu uzunlukta kesilir
+_TEXT_CAP = 8000
+
+class _TextCollector:
+    """
+    Paragrafları " " ile birleşik uzunluğu izleyerek toplar. Metin _TEXT_CAP'e
+    ulaşınca yeni paragraf almaz; extend() verilen üreteci orada bırakır, böylece
+    kalan paragrafların metni hiç çıkarılmaz.
+    """
+    __slots__ = ("parts", "length")
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.length = 0  # len(" ".join(parts))
+
+    @property
+    def full(self) -> bool:
+        return self.length >= _TEXT_CAP
+
+    def extend(self, texts) -> None:
+        for txt in texts:
+            if self.full:
+                return
+            self.length += len(txt) + 1 if self.parts else len(txt)
+            self.parts.append(txt)
+
+    def text(self) -> str:
+        return " ".join(self.parts)[:_TEXT_CAP]
+
+# Strategy 2 içerik kapsayıcıları (selectolax CSS seçicileri)
+_CONTENT_SELECTORS = ("main", ".article-body", ".post-content", ".entry-content", "[role='main']")
+
+def _extract_with_selectolax(html: str) -> tuple[str, str]:
+    """selectolax (lexbor C parser) ile başlık ve metin çıkarımı"""
+    tree = LexborHTMLParser(html)
+    # Başlık - multiple strategies
+    headline = ""
+    # Strategy 1: Title tag
+    title = tree.css_first("title")
+    if title:
+        headline = title.text().strip()
+    # Strategy 2: H1 tag
+    if not headline:
+        h1 = tree.css_first("h1")
+        if h1:
+            headline = h1.text(strip=True)
+    # Strategy 3: Meta og:title
+    if not headline:
+        og_title = tree.css_first('meta[property="og:title"]')
+        if og_title and og_title.attributes.get("content"):
+            headline = og_title.attributes["content"].strip()
+    # Strategy 4: Meta title
+    if not headline:
+        meta_title = tree.css_first('meta[name="title"]')
+        if meta_title and meta_title.attributes.get("content"):
+            headline = meta_title.attributes["content"].strip()
+    headline = headline or "Untitled"
+
+    # Metin - multiple strategies
+    def paragraphs(container):
+        # Üretici: metin sınırı dolunca kalan <p>'ler için text() çağrılmaz
+        for p in container.css("p"):
+            txt = p.text(separator=" ", strip=True)
+            if txt and len(txt) > 20:  # Filter very short paragraphs
+                yield txt
+
+    collected = _TextCollector()
+    # Strategy 1: Article tag
+    article = tree.css_first("article")
+    if article:
+        collected.extend(paragraphs(article))
+    # Strategy 2: Main content areas
+    if collected.length < 200:
+        for selector in _CONTENT_SELECTORS:
+            main_content = tree.css_first(selector)
+            if main_content:
+                collected.extend(paragraphs(main_content))
+                if collected.length > 200:
+                    break
+    # Strategy 3: All paragraphs (fallback)
+    if collected.length < 200:
+        collected.extend(paragraphs(tree))
+    return headline, collected.text()
+
+# Çıkarımda bakılan etiketler ve içerik kapsayıcıları (alt ağaçlarıyla birlikte)
+_STRAINER_TAGS = frozenset({"title", "h1", "meta", "article", "main", "p"})
+_STRAINER_CLASSES = frozenset({"article-body", "post-content", "entry-content"})
+
+class _ExtractionStrainer(SoupStrainer):
+    """
+    Sadece çıkarım stratejilerinin kullandığı etiketleri (ve alt ağaçlarını)
+    oluşturur. Etiket adı VEYA class/role eşleşmesi yeterli; SoupStrainer'ın
+    kendi kuralları bunları VE ile bağladığı için tag oluşturma kararı burada.
+    """
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        if name in _STRAINER_TAGS or attrs.get("role") == "main":
+            return True
+        classes = attrs.get("class")
+        if not classes:
+            return False
+        if isinstance(classes, str):
+            classes = classes.split()
+        return not _STRAINER_CLASSES.isdisjoint(classes)
+
+# İsim kuralları, üst seviyedeki serbest metinlerin de atlanmasını sağlar
+_STRAINER = _ExtractionStrainer(list(_STRAINER_TAGS))
+
+# Strategy 2 kapsayıcıları: main, .article-body, .post-content, .entry-content,
+# [role='main'] - CSS derlemesi (soupsieve) yerine doğrudan find() argümanları
+_CONTENT_FINDERS = (
+    {"name": "main"},
+    {"class_": "article-body"},
+    {"class_": "post-content"},
+    {"class_": "entry-content"},
+    {"attrs": {"role": "main"}},
+)
+
+def _extract_with_bs4(html: str) -> tuple[str, str]:
+    """BeautifulSoup ile başlık ve metin çıkarımı (selectolax yoksa)"""
+    soup = BeautifulSoup(html, BS4_PARSER, parse_only=_STRAINER)
+    # Başlık - multiple strategies
+    headline = ""
+    # Strategy 1: Title tag
+    if soup.title and soup.title.string:
+        headline = soup.title.string.strip()
+    # Strategy 2: H1 tag
+    if not headline:
+        h1 = soup.find("h1")
+        if h1 and h1.get_text(strip=True):
+            headline = h1.get_text(strip=True)
+    # Strategy 3: Meta og:title
+    if not headline:
+        og_title = soup.find("meta", property="og:title")
+        if og_title and og_title.get("content"):
+            headline = og_title.get("content").strip()
+    # Strategy 4: Meta title
+    if not headline:
+        meta_title = soup.find("meta", attrs={"name": "title"})
+        if meta_title and meta_title.get("content"):
+            headline = meta_title.get("content").strip()
+    headline = headline or "Untitled"
+
+    # Metin - multiple strategies
+    # Strategy'ler aynı <p> etiketlerini tekrar gezebilir; her <p>'nin
+    # metni bir kez çıkarılır (kısa paragraflar "" olarak saklanır)
+    paragraph_texts: Dict[int, str] = {}
+
+    def paragraphs(container):
+        # Üretici: metin sınırı dolunca kalan <p>'ler için get_text çağrılmaz
+        for p in container.find_all("p"):
+            key = id(p)
+            txt = paragraph_texts.get(key)
+            if txt is None:
+                txt = p.get_text(" ", strip=True)
+                if len(txt) <= 20:  # Filter very short paragraphs
+                    txt = ""
+                paragraph_texts[key] = txt
+            if txt:
+                yield txt
+
+    collected = _TextCollector()
+    # Strategy 1: Article tag
+    article = soup.find("article")
+    if article:
+        collected.extend(paragraphs(article))
+    # Strategy 2: Main content areas
+    if collected.length < 200:
+        for finder in _CONTENT_FINDERS:
+            main_content = soup.find(**finder)
+            if main_content:
+                collected.extend(paragraphs(main_content))
+                if collected.length > 200:
+                    break
+    # Strategy 3: All paragraphs (fallback)
+    if collected.length < 200:
+        collected.extend(paragraphs(soup))
+    return headline, collected.text()
+
+def _extract_with_trafilatura(html: str) -> tuple[str, str] | None:
+    """trafilatura ile ana metin çıkarımı (boilerplate temizlenmiş); bulamazsa None"""
+    extracted = trafilatura.extract(
+        html,
+        include_comments=False,
+        include_tables=False,
+        favor_precision=True,
+        with_metadata=True,
+        output_format="json"
+    )
+    if not extracted:
+        return None
+    extracted = json.loads(extracted)
+    text = " ".join((extracted.get("text") or "").split("\n")).strip()
+    if not text:
+        return None
+    return (extracted.get("title") or "").strip(), text[:8000]
+
+# C parser varsa onu kullan, yoksa BeautifulSoup
+_extract_html = _extract_with_selectolax if SELECTOLAX_AVAILABLE else _extract_with_bs4
+
+# True: fact-check sitesi kesin hüküm (FAKE/REAL) verdiyse sayfa gövdesi
+# ayrıştırılmaz; başlık ve özet <head> içinden regex ile alınır. Bu durumda
+# dönen haberin metni (istemciye giden, kaydedilen ve kategorilendiriciye
+# verilen) sadece meta description olur; metin uzunluğu/kanıt/propaganda gibi
+# kategori skorları değişir. Varsayılan kapalı: metin her zaman tam çıkarılır.
+SKIP_PARSE_ON_FACT_CHECK = False
+
+# <head> alanları için regex'ler (DOM kurmadan başlık/özet)
+_HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]{1,400})</title>", re.IGNORECASE)
+_OG_TITLE_RE = re.compile(
+    r'<meta[^>]+property=["\']og:title["\'][^>]+content=["\']([^"\']+)',
+    re.IGNORECASE
+)
+_META_TITLE_RE = re.compile(
+    r'<meta[^>]+name=["\']title["\'][^>]+content=["\']([^"\']+)',
+    re.IGNORECASE
+)
+_META_DESCRIPTION_RE = re.compile(
+    r'<meta[^>]+(?:name|property)=["\'](?:og:)?description["\'][^>]+content=["\']([^"\']*)',
+    re.IGNORECASE
+)
+
+def _head_end(html: str) -> int:
+    """</head> konumu (yoksa sayfa sonu); regex aramaları burada biter"""
+    match = _HEAD_END_RE.search(html)
+    return match.start() if match else len(html)
+
+def _extract_head_title(html: str, head_end: int | None = None) -> str:
+    """<title>, og:title, meta title sırasıyla başlık; bulunamazsa boş"""
+    if head_end is None:
+        head_end = _head_end(html)
+    for pattern in (_TITLE_RE, _OG_TITLE_RE, _META_TITLE_RE):
+        match = pattern.search(html, 0, head_end)
+        if match:
+            title = unescape(match.group(1)).strip()
+            if title:
+                return title
+    return ""
+
+def _extract_head_fields(html: str) -> tuple[str, str]:
+    """DOM kurmadan başlık ve meta description çıkarımı"""
+    head_end = _head_end(html)
+    description = _META_DESCRIPTION_RE.search(html, 0, head_end)
+    text = unescape(description.group(1)).strip() if description else ""
+    return _extract_head_title(html, head_end) or "Untitled", text[:8000]
+
+def _build_news_item(url: str, html_bytes: bytes, used_fallback: bool, fact_check_detector=None, charset: str | None = None) -> dict:
+    """İndirilen sayfadan haber öğesini oluştur (saf fonksiyon; parse worker'larında da çalışır)"""
+    html = _decode_html(html_bytes, charset)
+
+    # Check for fact-check result FIRST (before parsing)
+    fact_check_result = None
+    if fact_check_detector:
+        fact_check_result = fact_check_detector.extract_fact_check_result(url, html)
+
+    headline = ""
+    text = ""
+
+    if (
+        SKIP_PARSE_ON_FACT_CHECK
+        and not used_fallback
+        and fact_check_result
+        and fact_check_result.get("verdict") in ("FAKE", "REAL")
+    ):
+        headline, text = _extract_head_fields(html)
+    elif not used_fallback:
+        extracted = _extract_with_trafilatura(html) if TRAFILATURA_AVAILABLE else None
+        if extracted:
+            headline, text = extracted
+            # trafilatura başlık bulamazsa önce <head> regex'leri, o da olmazsa
+            # mevcut başlık stratejileri (tam ayrıştırma)
+            headline = headline or _extract_head_title(html) or _extract_html(html)[0]
+        else:
+            headline, text = _extract_html(html)
+    else:
+        # Text-only: ilk satırı başlık kabul etmeye çalış, kalanını metin yap
+        lines = [ln.strip() for ln in html.splitlines() if ln.strip()]
+        if lines:
+            cand = lines[0]
+            headline = cand if len(cand) <= 200 else "Untitled"
+            text = " ".join(lines[1:])[:8000] if headline != "Untitled" else " ".join(lines)[:8000]
+        headline = headline or "Untitled"
+        text = text or html[:8000]
+
+    result = {
+        "id": url,
+        "headline": headline,
+        "text": text,
+        "link": url
+    }
+
+    # Add fact-check result if found
+    if fact_check_result:
+        result["fact_check"] = fact_check_result
+        # If fact-check says it's fake, add indicators to text
+        if fact_check_result.get("verdict") == "FAKE":
+            result["text"] = f"[FACT-CHECK: {fact_check_result.get('site_name')} rated this as {fact_check_result.get('rating')}] " + result["text"]
+        elif fact_check_result.get("verdict") == "REAL":
+            result["text"] = f"[FACT-CHECK: {fact_check_result.get('site_name')} rated this as {fact_check_result.get('rating')}] " + result["text"]
+
+    return result
+
+# Parse worker'ları fork ile başlatılmaz: API/ajan thread'leri çalışan bir
+# process'i fork etmek kilitleri yarım kopyalayabilir
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Parse worker process'indeki fact-check dedektörü (initializer ile bir kez kurulur)
+_worker_fact_check_detector = None
+
+def _init_parse_worker():
+    """Parse worker başlangıcı"""
+    global _worker_fact_check_detector
+    if FACT_CHECK_AVAILABLE:
+        _worker_fact_check_detector = get_fact_check_detector()
+
+def _build_news_item_in_worker(url: str, html_bytes: bytes, used_fallback: bool, charset: str | None = None) -> dict:
+    """_build_news_item'ın worker process karşılığı"""
+    return _build_news_item(url, html_bytes, used_fallback, _worker_fact_check_detector, charset)
+
 class URLCrawlerAgent:
     """Haber sayfasından (URL) başlık ve metni çeker (retry + fallback ile dayanıklı)."""
-    def __init__(self):
+    def __init__(self, cache_dir: str | None = CRAWL_CACHE_DIR):
         if FACT_CHECK_AVAILABLE:
-            self.fact_check_detector = FactCheckDetector()
+            self.fact_check_detector = get_fact_check_detector()
         else:
             self.fact_check_detector = None
-    
-    def fetch_news(self, url: str) -> dict:
-        # 1) Önce standart URL’yi dene
+
+        # cache_dir=None veya diskcache yoksa önbellek kapalı
+        self._cache = None
+        if cache_dir and DISKCACHE_AVAILABLE:
+            self._cache = diskcache.Cache(cache_dir, size_limit=CRAWL_CACHE_SIZE_LIMIT)
+
+        # fetch_news_many için HTML parse havuzu (ilk büyük batch'te kurulur)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+    def close(self):
+        """Parse havuzunu kapat (sonraki büyük batch yeniden kurar)"""
+        pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def __del__(self):
+        pool = getattr(self, "_parse_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def fetch_news(self, url: str, bypass_cache: bool = False) -> dict:
+        # 0) Yakın zamanda çekilmişse önbellekten dön
+        entry, conditional_headers = (None, None) if bypass_cache else self._cache_lookup(url)
+        if entry and self._cache_is_fresh(entry):
+            return entry["parsed"]
+
+        # 1) Önce standart URL’yi dene (önbellekte varsa koşullu istek)
         html_bytes = None
+        response_headers = {}
         primary_error = None
         try:
-            html_bytes = _download(url)
+            html_bytes, response_headers = _download_response(url, headers=conditional_headers)
+        except HTTPError as e:
+            if e.code == 304 and entry:
+                self._cache_touch(url, entry)
+                return entry["parsed"]
+            primary_error = e
         except Exception as e:
             primary_error = e
 
@@ -69,100 +665,136 @@ class URLCrawlerAgent:
         used_fallback = False
         if html_bytes is None:
             try:
-                stripped = url.replace("https://", "").replace("http://", "")
-                fallback_url = f"https://r.jina.ai/http://{stripped}"
-                html_bytes = _download(fallback_url, headers={"Accept": "text/plain"})
+                html_bytes = _download(_fallback_url(url), headers=_FALLBACK_HEADERS)
                 used_fallback = True
             except Exception:
                 if primary_error:
                     raise RuntimeError(f"Failed to fetch {url}: {primary_error}") from primary_error
                 raise
 
-        html = html_bytes.decode("utf-8", errors="replace")
-        
-        # Check for fact-check result FIRST (before parsing)
-        fact_check_result = None
-        if self.fact_check_detector:
-            fact_check_result = self.fact_check_detector.extract_fact_check_result(url, html)
+        charset = None if used_fallback else _response_charset(response_headers)
+        result = self._build_news_item(url, html_bytes, used_fallback, charset)
+        if not used_fallback:
+            self._cache_store(url, html_bytes, response_headers, result)
+        return result
 
-        headline = ""
-        text = ""
+    async def fetch_news_many(self, urls: List[str]) -> list:
+        """
+        Birden fazla URL'yi eşzamanlı çeker; tüm istekler tek bir async client'ın
+        bağlantı havuzunu paylaşır. Sonuçlar URL sırasıyla döner, başarısız
+        URL'lerin yerinde exception nesnesi bulunur. Büyük batch'lerde HTML
+        ayrıştırma CPU çekirdeklerine dağıtılır.
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError(
+                "httpx is required for concurrent fetching. "
+                "Install it with: pip install httpx"
+            )
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+        )
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=DEFAULT_HEADERS,
+            limits=limits,
+            follow_redirects=True
+        ) as client:
+            use_pool = len(urls) >= PARSE_POOL_MIN_BATCH
+            return await asyncio.gather(
+                *(self._fetch_news_async(client, url, use_pool) for url in urls),
+                return_exceptions=True
+            )
 
-        if not used_fallback:
-            soup = BeautifulSoup(html, "html.parser")
-            # Başlık - multiple strategies
-            headline = ""
-            # Strategy 1: Title tag
-            if soup.title and soup.title.string:
-                headline = soup.title.string.strip()
-            # Strategy 2: H1 tag
-            if not headline:
-                h1 = soup.find("h1")
-                if h1 and h1.get_text(strip=True):
-                    headline = h1.get_text(strip=True)
-            # Strategy 3: Meta og:title
-            if not headline:
-                og_title = soup.find("meta", property="og:title")
-                if og_title and og_title.get("content"):
-                    headline = og_title.get("content").strip()
-            # Strategy 4: Meta title
-            if not headline:
-                meta_title = soup.find("meta", attrs={"name": "title"})
-                if meta_title and meta_title.get("content"):
-                    headline = meta_title.get("content").strip()
-            headline = headline or "Untitled"
-
-            # Metin - multiple strategies
-            parts = []
-            # Strategy 1: Article tag
-            article = soup.find("article")
-            if article:
-                for p in article.find_all("p"):
-                    txt = p.get_text(" ", strip=True)
-                    if txt and len(txt) > 20:  # Filter very short paragraphs
-                        parts.append(txt)
-            # Strategy 2: Main content areas
-            if not parts or len(" ".join(parts)) < 200:
-                for selector in ["main", ".article-body", ".post-content", ".entry-content", "[role='main']"]:
-                    main_content = soup.select_one(selector)
-                    if main_content:
-                        for p in main_content.find_all("p"):
-                            txt = p.get_text(" ", strip=True)
-                            if txt and len(txt) > 20:
-                                parts.append(txt)
-                        if len(" ".join(parts)) > 200:
-                            break
-            # Strategy 3: All paragraphs (fallback)
-            if not parts or len(" ".join(parts)) < 200:
-                for p in soup.find_all("p"):
-                    txt = p.get_text(" ", strip=True)
-                    if txt and len(txt) > 20:
-                        parts.append(txt)
-            text = " ".join(parts)[:8000]
+    def fetch_news_batch(self, urls: List[str]) -> list:
+        """
+        fetch_news_many'nin senkron karşılığı (çalışan bir event loop'u
+        olmayan çağıranlar için). Async kodda fetch_news_many kullanılmalı.
+        """
+        return asyncio.run(self.fetch_news_many(urls))
+
+    async def _fetch_news_async(self, client: "httpx.AsyncClient", url: str, use_pool: bool = False) -> dict:
+        """fetch_news'in async karşılığı (aynı fallback ve önbellek davranışı)"""
+        entry, conditional_headers = self._cache_lookup(url)
+        if entry and self._cache_is_fresh(entry):
+            return entry["parsed"]
+        try:
+            html_bytes, response_headers = await _download_async(client, url, headers=conditional_headers)
+            used_fallback = False
+        except Exception as primary_error:
+            if (entry and isinstance(primary_error, httpx.HTTPStatusError)
+                    and primary_error.response.status_code == 304):
+                self._cache_touch(url, entry)
+                return entry["parsed"]
+            try:
+                html_bytes, _ = await _download_async(client, _fallback_url(url), headers=_FALLBACK_HEADERS)
+                used_fallback = True
+            except Exception:
+                raise RuntimeError(f"Failed to fetch {url}: {primary_error}") from primary_error
+
+        charset = None if used_fallback else _response_charset(response_headers)
+        if use_pool:
+            result = await self._build_news_item_pooled(url, html_bytes, used_fallback, charset)
         else:
-            # Text-only: ilk satırı başlık kabul etmeye çalış, kalanını metin yap
-            lines = [ln.strip() for ln in html.splitlines() if ln.strip()]
-            if lines:
-                cand = lines[0]
-                headline = cand if len(cand) <= 200 else "Untitled"
-                text = " ".join(lines[1:])[:8000] if headline != "Untitled" else " ".join(lines)[:8000]
-            headline = headline or "Untitled"
-            text = text or html[:8000]
-
-        result = {
-            "id": url,
-            "headline": headline,
-            "text": text,
-            "link": url
-        }
-        
-        # Add fact-check result if found
-        if fact_check_result:
-            result["fact_check"] = fact_check_result
-            # If fact-check says it's fake, add indicators to text
-            if fact_check_result.get("verdict") == "FAKE":
-                result["text"] = f"[FACT-CHECK: {fact_check_result.get('site_name')} rated this as {fact_check_result.get('rating')}] " + result["text"]
-            elif fact_check_result.get("verdict") == "REAL":
-                result["text"] = f"[FACT-CHECK: {fact_check_result.get('site_name')} rated this as {fact_check_result.get('rating')}] " + result["text"]
-        
-        return result
\ No newline at end of file
+            result = self._build_news_item(url, html_bytes, used_fallback, charset)
+        if not used_fallback:
+            self._cache_store(url, html_bytes, response_headers, result)
+        return result
+
+    def _cache_lookup(self, url: str) -> tuple[dict | None, dict | None]:
+        """Önbellek kaydı ve ona göre If-None-Match / If-Modified-Since başlıkları"""
+        if self._cache is None:
+            return None, None
+        entry = self._cache.get(url)
+        if not entry:
+            return None, None
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("lm"):
+            headers["If-Modified-Since"] = entry["lm"]
+        return entry, headers
+
+    @staticmethod
+    def _cache_is_fresh(entry: dict) -> bool:
+        """Kayıt ağa gitmeden kullanılabilecek kadar yeni mi?"""
+        return time.time() - entry.get("fetched_at", 0) < CRAWL_CACHE_FRESH_SECONDS
+
+    def _cache_touch(self, url: str, entry: dict) -> None:
+        """304 sonrası kaydı yeniden taze say"""
+        entry["fetched_at"] = time.time()
+        self._cache.set(url, entry, expire=CRAWL_CACHE_TTL_SECONDS)
+
+    def _cache_store(self, url: str, html_bytes: bytes, response_headers: dict, result: dict) -> None:
+        """
+        Sayfayı ayrıştırılmış haliyle (fact-check sonucu dahil) sakla. Doğrulayıcısı
+        (ETag/Last-Modified) olanlar TTL boyunca koşullu istekle yenilenir, olmayanlar
+        tazelik süresi dolunca silinir.
+        """
+        if self._cache is None:
+            return
+        etag = response_headers.get("ETag") or response_headers.get("etag")
+        last_modified = response_headers.get("Last-Modified") or response_headers.get("last-modified")
+        expire = CRAWL_CACHE_TTL_SECONDS if (etag or last_modified) else CRAWL_CACHE_FRESH_SECONDS
+        self._cache.set(url, {
+            "body": html_bytes,
+            "etag": etag,
+            "lm": last_modified,
+            "parsed": result,
+            "fetched_at": time.time()
+        }, expire=expire)
+
+    def _build_news_item(self, url: str, html_bytes: bytes, used_fallback: bool, charset: str | None = None) -> dict:
+        """İndirilen sayfadan haber öğesini oluştur"""
+        return _build_news_item(url, html_bytes, used_fallback, self.fact_check_detector, charset)
+
+    async def _build_news_item_pooled(self, url: str, html_bytes: bytes, used_fallback: bool, charset: str | None = None) -> dict:
+        """_build_news_item'ı parse process havuzunda çalıştır (event loop bloklanmaz)"""
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=_POOL_CONTEXT,
+                initializer=_init_parse_worker
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_pool, _build_news_item_in_worker, url, html_bytes, used_fallback, charset)
\ No newline at end of file
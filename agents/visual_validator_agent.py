@@ -3,8 +3,24 @@ Visual Validator Agent (VVA)
 Görev: Görsel içerik analizi
 """
 from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+import hashlib
+import threading
 from .base_agent import BaseAgent
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Görsel analiz sonuçları için LRU önbellek boyutu (URL başına)
+_IMAGE_CACHE_SIZE = 1024
+
+# process_batch: bu kadar görselden itibaren güven skorları NumPy ile hesaplanır
+_VECTOR_CONFIDENCE_MIN_BATCH = 64
+
 
 class VisualValidatorAgent(BaseAgent):
     """
@@ -14,21 +30,61 @@ class VisualValidatorAgent(BaseAgent):
     
     def __init__(self):
         super().__init__("VVA")
-        self.image_cache: Dict[str, Dict[str, Any]] = {}
+        # URL özeti -> sadece görsele bağlı analizler (LRU)
+        self.image_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # API'nin worker thread'leri aynı ajanı eşzamanlı kullanır
+        self._cache_lock = threading.Lock()
     
     def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Ana işleme metodu"""
         image_url = data.get("image_url") or data.get("image")
         
         if not image_url:
-            return {
-                "status": "no_image",
-                "analysis": None
-            }
+            return self._no_image()
         
         # Görsel analizi
         analysis = self.analyze_image(data)
+        return self._finish(image_url, analysis)
+    
+    def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Birden fazla haberin görselini işle - güven skorları tüm batch için
+        tek seferde hesaplanır (sonuçlar process() ile aynı)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending = []  # (index, image_url, görsel analizi, tutarlılık)
+        for index, item in enumerate(items):
+            image_url = item.get("image_url") or item.get("image")
+            if not image_url:
+                results[index] = self._no_image()
+                continue
+            image_analysis = self._analyze_image_content(image_url)
+            consistency_score = self._check_image_text_consistency(
+                image_url, item.get("text", ""), item.get("headline", "")
+            )
+            pending.append((index, image_url, image_analysis, consistency_score))
         
+        scores = self._calculate_confidence_batch(
+            [consistency for _, _, _, consistency in pending],
+            [analysis["deepfake_probability"] for _, _, analysis, _ in pending],
+            [analysis["manipulation_probability"] for _, _, analysis, _ in pending],
+            [analysis["reverse_search"] for _, _, analysis, _ in pending]
+        )
+        for (index, image_url, image_analysis, consistency_score), score in zip(pending, scores):
+            analysis = self._build_analysis(image_analysis, consistency_score, score)
+            results[index] = self._finish(image_url, analysis)
+        return results
+    
+    @staticmethod
+    def _no_image() -> Dict[str, Any]:
+        """Görseli olmayan haber için sonuç"""
+        return {
+            "status": "no_image",
+            "analysis": None
+        }
+    
+    def _finish(self, image_url: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Sonucu oluştur ve diğer ajanlara gönder"""
         result = {
             "status": "analyzed",
             "image_url": image_url,
@@ -54,41 +110,77 @@ class VisualValidatorAgent(BaseAgent):
         text = item.get("text", "")
         headline = item.get("headline", "")
         
-        # 1. Image Captioning (BLIP-2 benzeri - placeholder)
-        caption = self._generate_caption(image_url)
+        # 1, 3, 4, 5: sadece görsele bağlı analizler (aynı URL için önbellekten)
+        image_analysis = self._analyze_image_content(image_url)
         
         # 2. Image-Text Matching (CLIP benzeri - placeholder)
         consistency_score = self._check_image_text_consistency(
             image_url, text, headline
         )
         
-        # 3. Deepfake Detection (placeholder)
-        deepfake_score = self._detect_deepfake(image_url)
-        
-        # 4. Image Manipulation Detection (placeholder)
-        manipulation_score = self._detect_manipulation(image_url)
-        
-        # 5. Reverse Image Search (placeholder)
-        reverse_search_results = self._reverse_image_search(image_url)
-        
         # Genel güven skoru
         overall_confidence = self._calculate_confidence(
             consistency_score,
-            deepfake_score,
-            manipulation_score,
-            reverse_search_results
+            image_analysis["deepfake_probability"],
+            image_analysis["manipulation_probability"],
+            image_analysis["reverse_search"]
         )
         
+        return self._build_analysis(image_analysis, consistency_score, overall_confidence)
+    
+    @staticmethod
+    def _build_analysis(
+        image_analysis: Dict[str, Any],
+        consistency_score: float,
+        overall_confidence: float
+    ) -> Dict[str, Any]:
+        """Görsel analizi sonucunu birleştir"""
         return {
-            "caption": caption,
+            "caption": image_analysis["caption"],
             "image_text_consistency": consistency_score,
-            "deepfake_probability": deepfake_score,
-            "manipulation_probability": manipulation_score,
-            "reverse_search": reverse_search_results,
+            "deepfake_probability": image_analysis["deepfake_probability"],
+            "manipulation_probability": image_analysis["manipulation_probability"],
+            "reverse_search": image_analysis["reverse_search"],
             "overall_confidence": overall_confidence,
             "is_suspicious": overall_confidence < 0.5
         }
     
+    def _analyze_image_content(self, image_url: str) -> Dict[str, Any]:
+        """Metinden bağımsız görsel analizleri (URL başına LRU önbellekli)"""
+        key = hashlib.blake2b(image_url.encode("utf-8"), digest_size=16).hexdigest()
+        with self._cache_lock:
+            cached = self.image_cache.get(key)
+            if cached is not None:
+                self.image_cache.move_to_end(key)
+                return cached
+        
+        # Modeller kilit dışında çalışır (aynı görsel eşzamanlı iki kez işlenebilir)
+        analysis = self._run_vision_models(image_url)
+        
+        with self._cache_lock:
+            self.image_cache[key] = analysis
+            if len(self.image_cache) > _IMAGE_CACHE_SIZE:
+                self.image_cache.popitem(last=False)
+        return analysis
+    
+    def _run_vision_models(self, image_url: str) -> Dict[str, Any]:
+        """
+        Görsele bağlı tüm modelleri tek noktadan çalıştır.
+        Gerçek modeller eklendiğinde görsel burada bir kez indirilip decode
+        edilmeli ve caption/deepfake/manipülasyon başlıkları aynı backbone
+        çıktısı üzerinde tek batch'te çalıştırılmalı.
+        """
+        return {
+            # 1. Image Captioning (BLIP-2 benzeri - placeholder)
+            "caption": self._generate_caption(image_url),
+            # 3. Deepfake Detection (placeholder)
+            "deepfake_probability": self._detect_deepfake(image_url),
+            # 4. Image Manipulation Detection (placeholder)
+            "manipulation_probability": self._detect_manipulation(image_url),
+            # 5. Reverse Image Search (placeholder)
+            "reverse_search": self._reverse_image_search(image_url)
+        }
+    
     def _generate_caption(self, image_url: str) -> str:
         """Görsel açıklama oluştur (BLIP-2 placeholder)"""
         # Gerçek uygulamada BLIP-2 modeli kullanılır
@@ -137,8 +229,36 @@ class VisualValidatorAgent(BaseAgent):
         penalty = (deepfake * 0.5) + (manipulation * 0.3)
         
         # Reverse search bonusu
-        bonus = 0.1 if reverse_search.get("has_results") and reverse_search.get("match_count", 0) > 0 else 0
+        bonus = 0.1 if self._has_reverse_match(reverse_search) else 0
         
         confidence = base_score - penalty + bonus
         return max(0.0, min(1.0, confidence))
+    
+    @staticmethod
+    def _has_reverse_match(reverse_search: Dict[str, Any]) -> bool:
+        """Ters görsel aramada eşleşme bulundu mu?"""
+        return bool(reverse_search.get("has_results") and reverse_search.get("match_count", 0) > 0)
+    
+    def _calculate_confidence_batch(
+        self,
+        consistency: List[float],
+        deepfake: List[float],
+        manipulation: List[float],
+        reverse_search: List[Dict[str, Any]]
+    ) -> List[float]:
+        """
+        _calculate_confidence'ın batch karşılığı. Büyük batch'lerde skorlar
+        alan başına birer dizide (SoA) toplanıp tek NumPy ifadesiyle hesaplanır;
+        işlem sırası skaler sürümle aynı olduğundan sonuçlar birebir eşittir.
+        """
+        if not NUMPY_AVAILABLE or len(consistency) < _VECTOR_CONFIDENCE_MIN_BATCH:
+            return [
+                self._calculate_confidence(*scores)
+                for scores in zip(consistency, deepfake, manipulation, reverse_search)
+            ]
+        
+        penalty = np.asarray(deepfake, dtype=np.float64) * 0.5 + np.asarray(manipulation, dtype=np.float64) * 0.3
+        bonus = np.array([self._has_reverse_match(rs) for rs in reverse_search], dtype=np.float64) * 0.1
+        confidence = np.asarray(consistency, dtype=np.float64) - penalty + bonus
+        return np.clip(confidence, 0.0, 1.0).tolist()
 
@@ -1,28 +1,118 @@
 """
 FastAPI REST API for Multi-Agent Fake News Detection System
 """
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import FileResponse, JSONResponse
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter, ValidationError
 from typing import Optional, Dict, Any, List
 import uvicorn
 import os
+import asyncio
+import functools
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from orchestrator import Orchestrator
 from fake_news_categorizer import FakeNewsCategorizer
-from storage import get_storage
+from storage import NewsStorage, get_storage
+from agent_trainer import get_agent_trainer
 from agents import URLCrawlerAgent
-import traceback
 import logging
-from datetime import datetime
+from datetime import date, datetime
 from collections.abc import Mapping, Iterable
+from contextlib import asynccontextmanager
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for types orjson can't serialize natively (mirrors _sanitize_for_json)"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Mapping):
+        return {str(k): v for k, v in obj.items()}
+    if isinstance(obj, Iterable):
+        return list(obj)
+    return str(obj)
+
+
+class ORJSONSafeResponse(JSONResponse):
+    """
+    JSON response rendered by orjson straight from pipeline results.
+    Unknown types go through _orjson_default; anything orjson still rejects
+    (e.g. tuple dict keys) is sanitized first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _dumps_json(content)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize a pipeline result to JSON bytes (orjson if installed)"""
+    if not ORJSON_AVAILABLE:
+        return json.dumps(_sanitize_for_json(obj), ensure_ascii=False).encode("utf-8")
+    try:
+        return orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return orjson.dumps(_sanitize_for_json(obj), option=_ORJSON_OPTIONS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Builds the global instances when a server process starts (importing the
+    module stays cheap). The worker pool lives for one lifespan: it is created
+    here and shut down on exit, so a later lifespan (e.g. another TestClient)
+    gets a fresh one while reusing the global instances.
+    """
+    global orchestrator, categorizer, storage, url_crawler, EXECUTOR, PIPELINE_EXECUTOR
+    EXECUTOR = ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS, thread_name_prefix="fnd-worker")
+    PIPELINE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fnd-pipeline")
+    if orchestrator is None:
+        # Independent constructors (model loading etc.) run side by side
+        orchestrator, categorizer, url_crawler = await asyncio.gather(
+            _run_blocking(Orchestrator),
+            _run_blocking(FakeNewsCategorizer),
+            _run_blocking(URLCrawlerAgent)
+        )
+        storage = get_storage()
+    batcher = _start_analyze_batcher()
+    yield
+    batcher.cancel()
+    executor, EXECUTOR = EXECUTOR, None
+    executor.shutdown(wait=True)
+    pipeline_executor, PIPELINE_EXECUTOR = PIPELINE_EXECUTOR, None
+    pipeline_executor.shutdown(wait=True)
+    # Process pools (created on the first large batch)
+    orchestrator.tca.close()
+    url_crawler.close()
+
 
 app = FastAPI(
     title="Multi-Agent Fake News Detection API",
     description="REST API for the multi-agent fake news detection system",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONSafeResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # CORS middleware
@@ -34,37 +124,398 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON bodies (pipeline results with all phases are large and
+# repetitive); small responses aren't worth the CPU
+GZIP_MINIMUM_SIZE = 1024
+GZIP_COMPRESS_LEVEL = 5
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESS_LEVEL)
+
 # Serve static files
 static_dir = os.path.join(os.path.dirname(__file__), "static")
 if os.path.exists(static_dir):
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
-# Global instances
-orchestrator = Orchestrator()
-categorizer = FakeNewsCategorizer()
-storage = get_storage()
-url_crawler = URLCrawlerAgent()
+# Global instances, created by lifespan()
+orchestrator: Optional[Orchestrator] = None
+categorizer: Optional[FakeNewsCategorizer] = None
+storage: Optional[NewsStorage] = None
+url_crawler: Optional[URLCrawlerAgent] = None
+
+# Categorization results of FAKE verdicts, LRU with a TTL
+CATEGORIZATION_CACHE_SIZE = 1024
+CATEGORIZATION_CACHE_TTL = 3600
+_categorization_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_categorization_lock = threading.Lock()
+
+
+def _categorize(
+    item: Dict[str, Any],
+    analyses: Dict[str, Any],
+    verdict: str,
+    confidence: float,
+    fact_check_result: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    categorizer.categorize, memoized per (verdict, confidence, item id/link, fact-check flag).
+    Runs on EXECUTOR threads, hence the lock. Treat the result as read-only.
+    """
+    item_key = item.get("id") or item.get("link")
+    # Non-FAKE verdicts return a constant result right away; nothing to cache
+    if verdict != "FAKE" or not item_key:
+        return categorizer.categorize(
+            item=item,
+            analyses=analyses,
+            verdict=verdict,
+            confidence=confidence,
+            fact_check_result=fact_check_result
+        )
+    
+    key = (verdict, confidence, item_key, fact_check_result is not None)
+    now = time.monotonic()
+    with _categorization_lock:
+        entry = _categorization_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _categorization_cache.move_to_end(key)
+            return entry[1]
+    
+    categorization = categorizer.categorize(
+        item=item,
+        analyses=analyses,
+        verdict=verdict,
+        confidence=confidence,
+        fact_check_result=fact_check_result
+    )
+    with _categorization_lock:
+        _categorization_cache[key] = (now + CATEGORIZATION_CACHE_TTL, categorization)
+        _categorization_cache.move_to_end(key)
+        if len(_categorization_cache) > CATEGORIZATION_CACHE_SIZE:
+            _categorization_cache.popitem(last=False)
+    return categorization
+
+# Simple keyword-based feedback sentiment lexicons for /feedbacks/stats
+_POSITIVE_FEEDBACK_WORDS = ("doğru", "haklı", "başarılı", "iyi", "güzel", "mükemmel", "correct", "right", "accurate")
+_NEGATIVE_FEEDBACK_WORDS = ("yanlış", "hatalı", "eksik", "yetersiz", "kötü", "başarısız", "wrong", "incorrect", "bad")
+
+# Sentiment counts of the stored feedbacks, tagged with the list they were computed for
+_feedback_stats: Dict[str, Any] = {"fingerprint": None, "positive": 0, "negative": 0, "neutral": 0}
+
+
+def _feedback_sentiment(feedback_text: str) -> str:
+    """positive / negative / neutral by lexicon hits"""
+    return _lowered_feedback_sentiment(feedback_text.lower())
+
+
+def _stored_feedback_sentiment(feedback: Dict[str, Any]) -> str:
+    """Sentiment of a stored feedback, using the lowercased copy saved at ingest"""
+    return _lowered_feedback_sentiment(
+        feedback.get("feedback_lc") or feedback.get("feedback", "").lower()
+    )
+
+
+def _lowered_feedback_sentiment(feedback_text: str) -> str:
+    """_feedback_sentiment for text that is already lowercased"""
+    # Plain substring checks: with 9 words per side and feedbacks capped
+    # at 500 chars, str.__contains__ beats a regex / Aho-Corasick pass
+    pos_count = sum(1 for word in _POSITIVE_FEEDBACK_WORDS if word in feedback_text)
+    neg_count = sum(1 for word in _NEGATIVE_FEEDBACK_WORDS if word in feedback_text)
+    if pos_count > neg_count:
+        return "positive"
+    if neg_count > pos_count:
+        return "negative"
+    return "neutral"
+
+
+def _feedbacks_fingerprint(feedbacks: List[Dict[str, Any]]) -> tuple:
+    """Identifies the feedback list (appends and front trimming both change it)"""
+    if not feedbacks:
+        return (0, None, None)
+    return (len(feedbacks), feedbacks[0].get("id"), feedbacks[-1].get("id"))
+
+
+async def _load_feedbacks() -> List[Dict[str, Any]]:
+    """
+    storage.get_feedbacks() for async handlers: answered from memory when the
+    file is unchanged, otherwise the file is parsed on a worker thread
+    """
+    if storage.feedbacks_cached():
+        return storage.get_feedbacks()
+    return await _run_blocking(storage.get_feedbacks)
+
+
+def _get_feedback_stats(feedbacks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sentiment counts, recomputed only when the feedback list changed"""
+    fingerprint = _feedbacks_fingerprint(feedbacks)
+    if _feedback_stats["fingerprint"] != fingerprint:
+        counts = {"positive": 0, "negative": 0, "neutral": 0}
+        for feedback in feedbacks:
+            counts[_stored_feedback_sentiment(feedback)] += 1
+        _feedback_stats.update(counts, fingerprint=fingerprint)
+    return _feedback_stats
+
+
+def _record_feedback_stats(previous_fingerprint: tuple, feedback_record: Dict[str, Any]):
+    """Update the cached counts for a feedback that was just appended"""
+    feedbacks = storage.get_feedbacks()
+    fingerprint = _feedbacks_fingerprint(feedbacks)
+    count, first_id, _ = previous_fingerprint
+    # Only a plain append (no trimming, no concurrent change) can be counted incrementally
+    expected = (count + 1, first_id or feedback_record.get("id"), feedback_record.get("id"))
+    if _feedback_stats["fingerprint"] == previous_fingerprint and fingerprint == expected:
+        _feedback_stats[_stored_feedback_sentiment(feedback_record)] += 1
+        _feedback_stats["fingerprint"] = fingerprint
+
+# Blocking pipeline calls (HTTP fetch, agent processing) run here so the
+# event loop keeps serving other requests while one is being analyzed.
+# Created by lifespan(); outside of it the loop's default executor is used.
+EXECUTOR_WORKERS = int(os.getenv("FND_WORKERS", "8"))
+EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a synchronous call in EXECUTOR and await its result"""
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    return await loop.run_in_executor(EXECUTOR, func, *args)
+
+
+# The orchestrator and its agents keep unsynchronized shared state (metrics,
+# pipeline_results, source/message dicts), so calls into it must not overlap.
+# They run on PIPELINE_EXECUTOR, a single worker created by lifespan(), and
+# under _pipeline_lock, which also covers calls made outside a lifespan.
+PIPELINE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_pipeline_lock = threading.Lock()
+
+
+def _call_serialized(func, *args):
+    with _pipeline_lock:
+        return func(*args)
+
+
+async def _run_pipeline(func, *args, **kwargs):
+    """Run an orchestrator call in PIPELINE_EXECUTOR, one at a time, and await its result"""
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    return await loop.run_in_executor(PIPELINE_EXECUTOR, _call_serialized, func, *args)
+
+
+# /analyze micro-batching: requests arriving within ANALYZE_BATCH_MAX_WAIT
+# seconds (up to ANALYZE_BATCH_MAX_SIZE) go through the orchestrator together
+ANALYZE_BATCH_MAX_SIZE = 16
+ANALYZE_BATCH_MAX_WAIT = 0.02
+_analyze_queue: Optional[asyncio.Queue] = None
+
+
+def _start_analyze_batcher() -> asyncio.Task:
+    """Create the /analyze queue and its consumer task (on the running loop)"""
+    global _analyze_queue
+    _analyze_queue = asyncio.Queue()
+    return asyncio.create_task(_analyze_batcher(_analyze_queue))
+
+
+async def _analyze_batcher(queue: asyncio.Queue):
+    """Background task: collect queued items into batches and resolve their futures"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + ANALYZE_BATCH_MAX_WAIT
+        while len(batch) < ANALYZE_BATCH_MAX_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        items = [item for item, _ in batch]
+        try:
+            results = await _run_pipeline(
+                orchestrator.process_news_items_batch, items, return_exceptions=True
+            )
+        except Exception as e:
+            results = [e] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue  # request was cancelled (client went away)
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+async def _process_news_item_batched(item: Dict[str, Any]) -> Dict[str, Any]:
+    """orchestrator.process_news_item through the micro-batcher"""
+    if _analyze_queue is None:
+        return await _run_pipeline(orchestrator.process_news_item, item)
+    future = asyncio.get_running_loop().create_future()
+    await _analyze_queue.put((item, future))
+    return await future
+
+
+# Analysis result cache (Redis, enabled when REDIS_URL is set).
+# Fact-check verdicts come from the source site and stay valid longer.
+RESULT_CACHE_TTL = 3600
+FACT_CHECK_CACHE_TTL = 86400
+_result_cache = None
+if REDIS_AVAILABLE and os.getenv("REDIS_URL"):
+    _result_cache = aioredis.from_url(
+        os.environ["REDIS_URL"],
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5
+    )
+
+
+def _url_cache_key(url: str) -> str:
+    """Cache key for /analyze-url (normalized URL)"""
+    return "fnd:url:" + hashlib.sha1(url.strip().lower().encode("utf-8")).hexdigest()
+
+
+def _item_cache_key(item: Dict[str, Any]) -> str:
+    """
+    Cache key for /analyze: every field of the dumped request model (id,
+    image_url and source change the result too), serialized with sorted keys
+    """
+    if ORJSON_AVAILABLE:
+        content = orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+    else:
+        content = json.dumps(item, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return "fnd:item:" + hashlib.sha1(content).hexdigest()
+
+
+def _item_index_key(item_id: str) -> str:
+    """Reverse index item_id -> result cache key (used by /feedback)"""
+    return "fnd:item-id:" + item_id
+
+
+async def _cache_get(key: str) -> Optional[bytes]:
+    """Cached JSON result, or None on a miss / when Redis is unavailable"""
+    if _result_cache is None:
+        return None
+    try:
+        return await _result_cache.get(key)
+    except Exception as e:
+        logging.warning("Result cache read failed: %s", e)
+        return None
+
+
+async def _cache_set(key: str, body: bytes, ttl: int, item_id: Optional[str] = None):
+    """Store a serialized result (and its item_id reverse index)"""
+    if _result_cache is None:
+        return
+    try:
+        async with _result_cache.pipeline(transaction=False) as pipe:
+            pipe.set(key, body, ex=ttl)
+            if item_id:
+                pipe.set(_item_index_key(str(item_id)), key, ex=ttl)
+            await pipe.execute()
+    except Exception as e:
+        logging.warning("Result cache write failed: %s", e)
+
+
+async def _cache_invalidate_item(item_id: str):
+    """Drop the cached result for an item (its verdict may change after feedback)"""
+    if _result_cache is None:
+        return
+    try:
+        index_key = _item_index_key(item_id)
+        key = await _result_cache.get(index_key)
+        if key:
+            await _result_cache.delete(key, index_key)
+    except Exception as e:
+        logging.warning("Result cache invalidation failed: %s", e)
+
+
+def _json_bytes_response(body: bytes) -> Response:
+    """Response for an already serialized (cached) result"""
+    return Response(content=body, media_type="application/json")
+
+# Exact types _sanitize_for_json passes through / copies without isinstance checks
+_JSON_SCALAR_TYPES = frozenset({type(None), bool, int, float, str})
+_JSON_SCALAR, _JSON_SEQUENCE, _JSON_MAPPING = range(3)
+_JSON_TYPE_KINDS = {
+    **dict.fromkeys(_JSON_SCALAR_TYPES, _JSON_SCALAR),
+    **dict.fromkeys((list, tuple, set, frozenset), _JSON_SEQUENCE),
+    **dict.fromkeys((dict, OrderedDict, defaultdict), _JSON_MAPPING)
+}
+# Leaf types with a JSON form of their own (same text orjson writes)
+_JSON_LEAF_CONVERTERS = {datetime: datetime.isoformat, date: date.isoformat}
+# Nesting limit (the recursive version was bounded by the interpreter's
+# recursion limit; this also stops self-referencing containers)
+_JSON_MAX_DEPTH = 1000
+
 
 def _sanitize_for_json(obj: Any) -> Any:
     """
     Ensure the object is JSON-serializable:
     - tuples/sets -> lists
     - mappings -> dict with string keys
+    - datetimes/dates -> ISO 8601 strings
     - other iterables -> list
+
+    Walks the tree with an explicit worklist instead of recursion. Each
+    container is copied once and its non-scalar slots are queued as
+    (container, key) pairs, then converted in place.
     """
-    # Simple types
-    if obj is None or isinstance(obj, (bool, int, float, str)):
-        return obj
-    # Tuples/Sets -> list
-    if isinstance(obj, (tuple, set)):
-        return [_sanitize_for_json(x) for x in obj]
-    # Dict-like
-    if isinstance(obj, Mapping):
-        return {str(k): _sanitize_for_json(v) for k, v in obj.items()}
+    root = [obj]
+    pending = [(root, 0, 0)]
+    while pending:
+        parent, key, depth = pending.pop()
+        value = parent[key]
+        cls = type(value)
+        kind = _JSON_TYPE_KINDS.get(cls)
+        if kind is None:
+            converter = _JSON_LEAF_CONVERTERS.get(cls)
+            if converter is not None:
+                parent[key] = converter(value)
+                continue
+            # Subclasses and other types: isinstance checks
+            if isinstance(value, (bool, int, float, str)):
+                kind = _JSON_SCALAR
+            elif isinstance(value, (tuple, set)):
+                kind = _JSON_SEQUENCE
+            elif isinstance(value, Mapping):
+                kind = _JSON_MAPPING
+        
+        if kind == _JSON_MAPPING:
+            converted = None
+        elif kind == _JSON_SEQUENCE:
+            converted = list(value)
+        elif kind == _JSON_SCALAR:
+            continue
+        else:
+            converted = _sanitize_leaf(value)
+            if type(converted) is not list:
+                parent[key] = converted
+                continue
+
+        if depth >= _JSON_MAX_DEPTH:
+            raise RecursionError("object nested too deeply to sanitize for JSON")
+        depth += 1
+        if converted is None:
+            # Mapping: string keys, values converted in place below
+            converted = {}
+            for k, v in value.items():
+                k = k if type(k) is str else str(k)
+                converted[k] = v
+                if type(v) not in _JSON_SCALAR_TYPES:
+                    pending.append((converted, k, depth))
+        else:
+            for index, v in enumerate(converted):
+                if type(v) not in _JSON_SCALAR_TYPES:
+                    pending.append((converted, index, depth))
+        parent[key] = converted
+    return root[0]
+
+
+def _sanitize_leaf(obj: Any) -> Any:
+    """Non-container fallback: other iterables -> list (elements unconverted), else str"""
     # List-like (but not str which was handled)
     if isinstance(obj, Iterable):
         try:
-            return [_sanitize_for_json(x) for x in obj]
+            return list(obj)
         except Exception:
             pass
     # Fallback to string
@@ -73,8 +524,46 @@ def _sanitize_for_json(obj: Any) -> Any:
     except Exception:
         return None
 
-# Request/Response models
+
+def _json_response(obj: Any) -> Response:
+    """
+    Endpoint return value for a pipeline result, serialized once by
+    _dumps_json (skips FastAPI's jsonable_encoder walk with or without orjson)
+    """
+    return _json_bytes_response(_dumps_json(obj))
+
+
+# /statistics and /metrics/* are polled by dashboards: a computed body is
+# reused for AGGREGATE_CACHE_TTL seconds (and clients may cache it as long)
+AGGREGATE_CACHE_TTL = 1.0
+AGGREGATE_CACHE_MAX_ENTRIES = 256
+_AGGREGATE_CACHE_CONTROL = f"public, max-age={int(AGGREGATE_CACHE_TTL)}"
+# (getter name, args) -> (expires at, serialized body)
+_aggregate_cache: Dict[tuple, tuple] = {}
+
+
+async def _aggregate_response(func, *args) -> Response:
+    """Serialized result of an orchestrator aggregate getter, memoized briefly"""
+    key = (func.__name__,) + args
+    now = time.monotonic()
+    entry = _aggregate_cache.get(key)
+    if entry is None or entry[0] <= now:
+        body = _dumps_json(await _run_blocking(func, *args))
+        if len(_aggregate_cache) >= AGGREGATE_CACHE_MAX_ENTRIES:
+            _aggregate_cache.clear()  # keys include query params; keep it bounded
+        entry = (now + AGGREGATE_CACHE_TTL, body)
+        _aggregate_cache[key] = entry
+    response = _json_bytes_response(entry[1])
+    response.headers["Cache-Control"] = _AGGREGATE_CACHE_CONTROL
+    return response
+
+# Request/Response models (validated once, then only read / dumped)
+_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
+
 class NewsItemRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+    
     id: Optional[str] = None
     headline: Optional[str] = None
     text: Optional[str] = None
@@ -83,7 +572,13 @@ class NewsItemRequest(BaseModel):
     source: Optional[str] = None
 
 
+# Built once; used to validate plain dict bodies
+_NEWS_ITEM_ADAPTER = TypeAdapter(NewsItemRequest)
+
+
 class NewsItemResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+    
     status: str
     item: Dict[str, Any]
     verdict: str
@@ -93,6 +588,12 @@ class NewsItemResponse(BaseModel):
     timestamp: str
 
 
+class UrlRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+    
+    url: HttpUrl
+
+
 class StatisticsResponse(BaseModel):
     total_processed: int
     verdict_distribution: Dict[str, int]
@@ -100,60 +601,67 @@ class StatisticsResponse(BaseModel):
     last_processed: Optional[str]
 
 
+# Static payloads, serialized once at import (/health is polled by load balancers)
+_ROOT_INFO_BYTES = _dumps_json({
+    "message": "Multi-Agent Fake News Detection API",
+    "version": "1.0.0",
+    "endpoints": {
+        "POST /analyze": "Analyze a news item",
+        "POST /analyze-url": "Analyze news from URL",
+        "GET /recent-checks": "Get recent checks",
+        "GET /weekly-top": "Get weekly top checked",
+        "GET /statistics": "Get pipeline statistics",
+        "GET /health": "Health check",
+        "GET /metrics/summary": "Get overall metrics summary",
+        "GET /metrics/agents": "Get agent metrics",
+        "GET /metrics/phases": "Get phase metrics",
+        "GET /training/analyze": "Analyze agent performance",
+        "GET /training/report": "Get training report",
+        "POST /training/train/{agent_id}": "Train an agent",
+        "GET /training/adjustments/{agent_id}": "Get agent adjustments"
+    }
+})
+
+_HEALTH_BYTES = _dumps_json({
+    "status": "healthy",
+    "agents": {
+        "crawler": "active",
+        "source_tracker": "active",
+        "preprocessing": "active",
+        "visual_validator": "active",
+        "textual_context": "active",
+        "claim": "active",
+        "challenge": "active",
+        "refuter": "active",
+        "judge": "active",
+        "meta_evaluator": "active",
+        "optimizer": "active",
+        "reinforcement": "active",
+        "correction": "active"
+    }
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint - serve web interface"""
     static_file = os.path.join(static_dir, "index.html")
     if os.path.exists(static_file):
         return FileResponse(static_file)
-    return {
-        "message": "Multi-Agent Fake News Detection API",
-        "version": "1.0.0",
-        "endpoints": {
-            "POST /analyze": "Analyze a news item",
-            "POST /analyze-url": "Analyze news from URL",
-            "GET /recent-checks": "Get recent checks",
-            "GET /weekly-top": "Get weekly top checked",
-            "GET /statistics": "Get pipeline statistics",
-            "GET /health": "Health check",
-            "GET /metrics/summary": "Get overall metrics summary",
-            "GET /metrics/agents": "Get agent metrics",
-            "GET /metrics/phases": "Get phase metrics",
-            "GET /training/analyze": "Analyze agent performance",
-            "GET /training/report": "Get training report",
-            "POST /training/train/{agent_id}": "Train an agent",
-            "GET /training/adjustments/{agent_id}": "Get agent adjustments"
-        }
-    }
+    return _json_bytes_response(_ROOT_INFO_BYTES)
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "agents": {
-            "crawler": "active",
-            "source_tracker": "active",
-            "preprocessing": "active",
-            "visual_validator": "active",
-            "textual_context": "active",
-            "claim": "active",
-            "challenge": "active",
-            "refuter": "active",
-            "judge": "active",
-            "meta_evaluator": "active",
-            "optimizer": "active",
-            "reinforcement": "active",
-            "correction": "active"
-        }
-    }
+    return _json_bytes_response(_HEALTH_BYTES)
 
 
 @app.post("/analyze")
 async def analyze_news(
     item: NewsItemRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    force: bool = False
 ):
     """
     Analyze a news item for fake news detection
@@ -164,45 +672,56 @@ async def analyze_news(
     - **link**: Source URL
     - **image_url**: Optional image URL
     - **source**: Optional source name
+    - **force**: Query flag, bypass the result cache
     """
     try:
         # Convert request to dict
-        # Pydantic v2: model_dump replaces dict()
-        item_dict = item.model_dump(exclude_none=True)
+        # Pydantic v2: model_dump replaces dict(); mode="json" yields JSON-safe primitives
+        item_dict = item.model_dump(exclude_none=True, mode="json")
         
-        # Process through pipeline
-        result = orchestrator.process_news_item(item_dict)
+        cache_key = _item_cache_key(item_dict)
+        if not force:
+            cached = await _cache_get(cache_key)
+            if cached is not None:
+                return _json_bytes_response(cached)
+        
+        # Process through pipeline (batched with concurrent /analyze requests)
+        result = await _process_news_item_batched(item_dict)
 
         # Normalize result to match NewsItemResponse even for early exits (spam/duplicate)
         normalized = _build_response_from_pipeline(result)
         
-        # Sanitize for JSON / Pydantic
-        safe_result = _sanitize_for_json(normalized)
-        # Return raw JSON-safe dict (bypass response_model while debugging)
-        return safe_result
+        # Return JSON-safe response (bypass response_model while debugging)
+        body = _dumps_json(normalized)
+        await _cache_set(cache_key, body, RESULT_CACHE_TTL, normalized.get("item", {}).get("id"))
+        return _json_bytes_response(body)
     
     except Exception as e:
         # Return clearer error in API response
-        logging.error("Analyze error: %s", e)
-        traceback.print_exc()
+        logging.error("Analyze error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Processing error: {e}")
 
 
 @app.post("/analyze_raw")
-async def analyze_news_raw(
-    item: NewsItemRequest,
-):
+async def analyze_news_raw(request: Dict[str, Any]):
     """
     Debug endpoint: returns raw orchestrator output without response_model validation.
     Useful to diagnose serialization/validation issues causing 500 errors.
+    Body fields are the same as /analyze (validated against NewsItemRequest).
     """
     try:
-        item_dict = item.model_dump(exclude_none=True)
-        result = orchestrator.process_news_item(item_dict)
-        return _sanitize_for_json(result)
+        item = _NEWS_ITEM_ADAPTER.validate_python(request)
+    except ValidationError as e:
+        # Same 422 shape as a model-typed body
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+    try:
+        item_dict = item.model_dump(exclude_none=True, mode="json")
+        result = await _run_pipeline(orchestrator.process_news_item, item_dict)
+        return _json_response(result)
     except Exception as e:
-        logging.error("Analyze RAW error: %s", e)
-        traceback.print_exc()
+        logging.error("Analyze RAW error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Processing error (raw): {e}")
 
 
@@ -248,12 +767,12 @@ def _build_response_from_pipeline(pipeline_result: Dict[str, Any]) -> Dict[str,
     }
 
 
-@app.get("/statistics", response_model=StatisticsResponse)
+@app.get("/statistics", responses={200: {"model": StatisticsResponse}})
 async def get_statistics():
     """Get pipeline statistics"""
     try:
-        stats = orchestrator.get_pipeline_statistics()
-        return StatisticsResponse(**stats)
+        # Plain dict straight to the (orjson) response; the model only documents the shape
+        return await _aggregate_response(orchestrator.get_pipeline_statistics)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -263,19 +782,18 @@ async def get_agent_state(agent_id: str):
     """Get state of a specific agent"""
     # This would require exposing agent states
     # For now, return placeholder
-    return {
+    return _json_response({
         "agent_id": agent_id,
         "status": "active",
         "note": "Agent state retrieval not fully implemented"
-    }
+    })
 
 
 @app.get("/metrics/summary")
 async def get_metrics_summary():
     """Get overall performance metrics summary"""
     try:
-        summary = orchestrator.get_metrics_summary()
-        return summary
+        return await _aggregate_response(orchestrator.get_metrics_summary)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -284,8 +802,7 @@ async def get_metrics_summary():
 async def get_agent_metrics(agent_id: Optional[str] = None):
     """Get metrics for all agents or a specific agent"""
     try:
-        metrics = orchestrator.get_agent_metrics(agent_id)
-        return metrics
+        return await _aggregate_response(orchestrator.get_agent_metrics, agent_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -294,8 +811,7 @@ async def get_agent_metrics(agent_id: Optional[str] = None):
 async def get_phase_metrics(phase_name: Optional[str] = None):
     """Get metrics for all phases or a specific phase"""
     try:
-        metrics = orchestrator.get_phase_metrics(phase_name)
-        return metrics
+        return await _aggregate_response(orchestrator.get_phase_metrics, phase_name)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -304,10 +820,8 @@ async def get_phase_metrics(phase_name: Optional[str] = None):
 async def analyze_agent_performance():
     """Analyze agent performance and identify underperformers"""
     try:
-        from agent_trainer import get_agent_trainer
         trainer = get_agent_trainer()
-        analysis = trainer.analyze_agent_performance()
-        return analysis
+        return _json_response(await _run_blocking(trainer.analyze_agent_performance))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -316,10 +830,8 @@ async def analyze_agent_performance():
 async def get_training_report():
     """Get comprehensive training report"""
     try:
-        from agent_trainer import get_agent_trainer
         trainer = get_agent_trainer()
-        report = trainer.get_training_report()
-        return report
+        return _json_response(await _run_blocking(trainer.get_training_report))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -328,9 +840,8 @@ async def get_training_report():
 async def train_agent(agent_id: str):
     """Apply training to a specific agent"""
     try:
-        from agent_trainer import get_agent_trainer
         trainer = get_agent_trainer()
-        analysis = trainer.analyze_agent_performance()
+        analysis = await _run_blocking(trainer.analyze_agent_performance)
         
         # Find recommendations for this agent
         recommendations = analysis.get("recommendations", {}).get(agent_id)
@@ -341,8 +852,8 @@ async def train_agent(agent_id: str):
             )
         
         # Apply training
-        result = trainer.apply_training(agent_id, recommendations)
-        return result
+        result = await _run_blocking(trainer.apply_training, agent_id, recommendations)
+        return _json_response(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -353,45 +864,39 @@ async def train_agent(agent_id: str):
 async def get_agent_adjustments(agent_id: str):
     """Get current adjustments for an agent"""
     try:
-        from agent_trainer import get_agent_trainer
         trainer = get_agent_trainer()
-        adjustments = trainer.get_agent_adjustments(agent_id)
-        return {"agent_id": agent_id, "adjustments": adjustments}
+        adjustments = await _run_blocking(trainer.get_agent_adjustments, agent_id)
+        return _json_response({"agent_id": agent_id, "adjustments": adjustments})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/analyze-url")
-async def analyze_url(request: Dict[str, Any]):
+async def analyze_url(
+    request: UrlRequest,
+    background_tasks: BackgroundTasks,
+    force: bool = False
+):
     """
     Analyze news from URL
     Fetches the URL, extracts content, and analyzes it
-    Expected body: {"url": "https://..."}
+    Expected body: {"url": "https://..."} (an http(s) URL, validated by UrlRequest)
+    Results are cached per URL; ?force=1 re-runs the analysis.
+    Storage and cache writes run after the response is sent.
     """
+    url = str(request.url)
     try:
-        # Extract URL from request
-        if not isinstance(request, dict):
-            raise HTTPException(status_code=400, detail="Invalid request format")
-        
-        url = request.get("url")
-        if not url or not isinstance(url, str) or not url.strip():
-            raise HTTPException(status_code=400, detail="URL parameter is required and must be a non-empty string")
-        
-        url = url.strip()
-    except HTTPException:
-        raise
-    except Exception as e:
-        logging.error(f"Request parsing error: {e}")
-        raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
-    try:
-        # Add timestamp to URL to prevent caching issues
-        # This ensures each analysis is fresh, even for the same URL
-        import time
-        cache_buster = int(time.time() * 1000)  # milliseconds
-        logging.info(f"Analyzing URL: {url} (cache_buster: {cache_buster})")
+        cache_key = _url_cache_key(url)
+        if not force:
+            cached = await _cache_get(cache_key)
+            if cached is not None:
+                # Still recorded as a check (recent checks / weekly top)
+                background_tasks.add_task(storage.add_check, json.loads(cached))
+                return _json_bytes_response(cached)
+        logging.info(f"Analyzing URL: {url}")
         
         # Fetch content from URL
-        news_item = url_crawler.fetch_news(url=url)
+        news_item = await _run_blocking(url_crawler.fetch_news, url)
         
         # Check for fact-check result
         fact_check = news_item.get("fact_check")
@@ -408,7 +913,8 @@ async def analyze_url(request: Dict[str, Any]):
             
             
             # Still categorize if fake
-            categorization = categorizer.categorize(
+            categorization = await _run_blocking(
+                _categorize,
                 item=news_item,
                 analyses={},
                 verdict=verdict,
@@ -431,24 +937,29 @@ async def analyze_url(request: Dict[str, Any]):
                 },
                 "timestamp": datetime.utcnow().isoformat()
             }
-            result.update(categorization)
-            
-            # Ensure is_fake is set correctly based on verdict
-            result["is_fake"] = (verdict == "FAKE")
-            result["verdict"] = verdict
+            # Categorization also carries is_fake; the fact-check verdict wins
+            result = {
+                **result,
+                **categorization,
+                "verdict": verdict,
+                "is_fake": verdict == "FAKE"
+            }
             
-            # Save to storage
-            storage.add_check(result)
-            return _sanitize_for_json(result)
+            body = _dumps_json(result)
+            # Save to storage / cache once the response is out
+            background_tasks.add_task(storage.add_check, result)
+            background_tasks.add_task(_cache_set, cache_key, body, FACT_CHECK_CACHE_TTL, news_item.get("id"))
+            return _json_bytes_response(body)
         
         # Process through pipeline (normal flow)
-        result = orchestrator.process_news_item(news_item)
+        result = await _run_pipeline(orchestrator.process_news_item, news_item)
         
         # Categorize if fake
         verdict = result.get("verdict", "UNSURE")
         confidence = result.get("confidence", 0.5)
         
-        categorization = categorizer.categorize(
+        categorization = await _run_blocking(
+            _categorize,
             item=result.get("item", {}),
             analyses=result.get("phases", {}),
             verdict=verdict,
@@ -456,33 +967,28 @@ async def analyze_url(request: Dict[str, Any]):
         )
         
         # Combine results
+        # CRITICAL: is_fake must follow the verdict, not the categorization
         final_result = {
             **result,
-            **categorization
+            **categorization,
+            "is_fake": verdict == "FAKE"
         }
         
-        # CRITICAL: Ensure is_fake is set correctly based on verdict
-        final_result["is_fake"] = (verdict == "FAKE")
+        # Serialize for JSON
+        body = _dumps_json(final_result)
         
-        # Save to storage
-        storage.add_check(final_result)
-        
-        # Sanitize for JSON
-        safe_result = _sanitize_for_json(final_result)
-        return safe_result
+        # Save to storage / cache once the response is out
+        background_tasks.add_task(storage.add_check, final_result)
+        background_tasks.add_task(_cache_set, cache_key, body, RESULT_CACHE_TTL, final_result.get("item", {}).get("id"))
+        return _json_bytes_response(body)
     
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
+        # The traceback goes to the log only, not to the client
         logging.error("Analyze URL error: %s", e, exc_info=True)
-        traceback.print_exc()
-        # Return more detailed error for debugging
-        error_detail = f"Processing error: {str(e)}"
-        if hasattr(e, '__traceback__'):
-            import traceback as tb
-            error_detail += f"\nTraceback: {''.join(tb.format_tb(e.__traceback__))}"
-        raise HTTPException(status_code=500, detail=error_detail)
+        raise HTTPException(status_code=500, detail=f"Processing error: {type(e).__name__}")
 
 
 @app.get("/recent-checks")
@@ -501,7 +1007,7 @@ async def get_recent_checks(limit: int = 5):
             }
             for check in checks
         ]
-        return {"recent": formatted_checks}
+        return _json_response({"recent": formatted_checks})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -521,109 +1027,124 @@ async def get_weekly_top(limit: int = 5):
             }
             for item in top_urls
         ]
-        return {"top": formatted_top}
+        return _json_response({"top": formatted_top})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 class FeedbackRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+    
     item_id: str = Field(..., description="News item ID")
     feedback: str = Field(..., min_length=1, max_length=500, description="User feedback (max 500 characters)")
     timestamp: Optional[str] = Field(None, description="Feedback timestamp")
 
 
+async def _process_feedback_learning(item_id: str, feedback: str, timestamp: str):
+    """
+    Background task: feed a saved feedback to the Reinforcement and Optimizer
+    agents. Errors are only logged, the feedback itself is already stored.
+    """
+    try:
+        # Get the original result from pipeline_results if available
+        # Otherwise, we'll use the feedback text to infer ground truth
+        rl_data = {
+            "state": {
+                "item_id": item_id,
+                "feedback": feedback
+            },
+            "action": "process_feedback",
+            "reward": None  # Will be calculated based on feedback sentiment
+        }
+        
+        # Process through Reinforcement Agent
+        await _run_pipeline(orchestrator.rla.process, rl_data)
+        
+        # Also send to Optimizer Agent for weight adjustments
+        optimizer_data = {
+            "performance_metrics": {
+                "user_feedback": feedback,
+                "item_id": item_id
+            },
+            "meta_feedback": {
+                "feedback_text": feedback,
+                "timestamp": timestamp
+            }
+        }
+        await _run_pipeline(orchestrator.oa.process, optimizer_data)
+    except Exception as rl_error:
+        # Log RL processing error; the feedback is still saved
+        logging.error(f"RL processing error (feedback still saved): {rl_error}", exc_info=True)
+
+
 @app.post("/feedback")
-async def submit_feedback(feedback_request: FeedbackRequest):
-    """Submit user feedback for reinforcement learning"""
+async def submit_feedback(feedback_request: FeedbackRequest, background_tasks: BackgroundTasks):
+    """
+    Submit user feedback for reinforcement learning
+    The feedback is saved right away; RL/optimizer processing runs after the
+    response is sent (status "accepted").
+    """
     try:
-        # Save feedback to storage
+        # Save feedback to storage (a single appended line)
+        previous_fingerprint = _feedbacks_fingerprint(await _load_feedbacks())
         feedback_record = storage.add_feedback(
             item_id=feedback_request.item_id,
             feedback=feedback_request.feedback,
-            timestamp=feedback_request.timestamp or datetime.utcnow().isoformat()
+            timestamp=feedback_request.timestamp or datetime.utcnow().isoformat(),
+            # Lowercased once here instead of on every stats recount
+            feedback_lc=feedback_request.feedback.lower()
         )
+        _record_feedback_stats(previous_fingerprint, feedback_record)
+        # Feedback may change the verdict; don't keep serving the cached one
+        await _cache_invalidate_item(feedback_request.item_id)
         
-        # Process feedback through Reinforcement Agent
-        # Find the original analysis result for this item
-        # We'll use the feedback to calculate reward and update RL system
-        try:
-            # Get the original result from pipeline_results if available
-            # Otherwise, we'll use the feedback text to infer ground truth
-            rl_data = {
-                "state": {
-                    "item_id": feedback_request.item_id,
-                    "feedback": feedback_request.feedback
-                },
-                "action": "process_feedback",
-                "reward": None  # Will be calculated based on feedback sentiment
-            }
-            
-            # Process through Reinforcement Agent
-            rl_result = orchestrator.rla.process(rl_data)
-            
-            # Also send to Optimizer Agent for weight adjustments
-            optimizer_data = {
-                "performance_metrics": {
-                    "user_feedback": feedback_request.feedback,
-                    "item_id": feedback_request.item_id
-                },
-                "meta_feedback": {
-                    "feedback_text": feedback_request.feedback,
-                    "timestamp": feedback_record["timestamp"]
-                }
-            }
-            optimizer_result = orchestrator.oa.process(optimizer_data)
-            
-            # Calculate reward from feedback
-            reward = orchestrator.rla._calculate_reward_from_feedback(feedback_request.feedback)
-            
-            return {
-                "status": "success",
-                "message": "Feedback received and processed for system learning",
-                "feedback_id": feedback_record["id"],
-                "rl_result": rl_result,
-                "optimizer_result": optimizer_result,
-                "calculated_reward": reward,
-                "processed_at": datetime.utcnow().isoformat()
-            }
-        except Exception as rl_error:
-            # Log RL processing error but don't fail the request
-            logging.error(f"RL processing error (feedback still saved): {rl_error}", exc_info=True)
-            return {
-                "status": "success",
-                "message": "Feedback received and saved",
-                "feedback_id": feedback_record["id"],
-                "note": "RL processing encountered an error, but feedback was saved",
-                "error": str(rl_error)
-            }
+        # Process feedback through Reinforcement / Optimizer agents
+        background_tasks.add_task(
+            _process_feedback_learning,
+            feedback_request.item_id,
+            feedback_request.feedback,
+            feedback_record["timestamp"]
+        )
+        
+        # Calculate reward from feedback
+        reward = orchestrator.rla._calculate_reward_from_feedback(feedback_request.feedback)
+        
+        return _json_response({
+            "status": "accepted",
+            "message": "Feedback received; it will be processed for system learning",
+            "feedback_id": feedback_record["id"],
+            "calculated_reward": reward,
+            "accepted_at": datetime.utcnow().isoformat()
+        })
             
     except Exception as e:
         logging.error(f"Feedback submission error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error processing feedback: {str(e)}")
 
 
+# Fields storage keeps for internal use only, never returned by /feedbacks
+_INTERNAL_FEEDBACK_FIELDS = frozenset({"feedback_lc"})
+
+
+def _public_feedback(feedback: Dict[str, Any]) -> Dict[str, Any]:
+    """Stored feedback record without the internal fields"""
+    return {k: v for k, v in feedback.items() if k not in _INTERNAL_FEEDBACK_FIELDS}
+
+
 @app.get("/feedbacks")
 async def get_feedbacks(limit: int = 20):
     """Get recent user feedbacks"""
     try:
-        # Use storage's internal method to get feedbacks
-        import json
-        import os
-        storage_file = "logs/news_checks.json"
-        if not os.path.exists(storage_file):
-            return {"feedbacks": [], "total": 0, "returned": 0}
-        
-        with open(storage_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        feedbacks = data.get("feedbacks", [])
+        # Served from memory; a changed file is parsed on a worker thread
+        feedbacks = await _load_feedbacks()
         # Return most recent feedbacks
-        recent_feedbacks = feedbacks[-limit:][::-1]  # Reverse to show newest first
-        return {
+        # Reverse to show newest first
+        recent_feedbacks = [_public_feedback(feedback) for feedback in reversed(feedbacks[-limit:])]
+        return _json_response({
             "feedbacks": recent_feedbacks,
             "total": len(feedbacks),
             "returned": len(recent_feedbacks)
-        }
+        })
     except Exception as e:
         logging.error(f"Error getting feedbacks: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -633,54 +1154,42 @@ async def get_feedbacks(limit: int = 20):
 async def get_feedback_stats():
     """Get feedback statistics"""
     try:
-        import json
-        import os
-        storage_file = "logs/news_checks.json"
-        if not os.path.exists(storage_file):
-            return {"total_feedbacks": 0, "sentiment": {"positive": 0, "negative": 0, "neutral": 0}, "processed_by_rl": False}
-        
-        with open(storage_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        feedbacks = data.get("feedbacks", [])
+        feedbacks = await _load_feedbacks()
         
         # Calculate statistics
         total = len(feedbacks)
         
-        # Analyze sentiment (simple keyword-based)
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-        
-        positive_words = ["doğru", "haklı", "başarılı", "iyi", "güzel", "mükemmel", "correct", "right", "accurate"]
-        negative_words = ["yanlış", "hatalı", "eksik", "yetersiz", "kötü", "başarısız", "wrong", "incorrect", "bad"]
+        # Analyze sentiment (simple keyword-based, cached until feedbacks change)
+        stats = _get_feedback_stats(feedbacks)
         
-        for feedback in feedbacks:
-            feedback_text = feedback.get("feedback", "").lower()
-            pos_count = sum(1 for word in positive_words if word in feedback_text)
-            neg_count = sum(1 for word in negative_words if word in feedback_text)
-            
-            if pos_count > neg_count:
-                positive_count += 1
-            elif neg_count > pos_count:
-                negative_count += 1
-            else:
-                neutral_count += 1
-        
-        return {
+        return _json_response({
             "total_feedbacks": total,
             "sentiment": {
-                "positive": positive_count,
-                "negative": negative_count,
-                "neutral": neutral_count
+                "positive": stats["positive"],
+                "negative": stats["negative"],
+                "neutral": stats["neutral"]
             },
             "processed_by_rl": total > 0  # All feedbacks are processed by RL
-        }
+        })
     except Exception as e:
         logging.error(f"Error getting feedback stats: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools come with uvicorn[standard] ("auto" falls back to asyncio/h11).
+    # WEB_CONCURRENCY > 1 starts that many worker processes; each one imports
+    # this module itself, so orchestrator/storage/crawler are per process.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "api:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=workers,
+        # Shed load with 503s instead of queueing without bound
+        limit_concurrency=1000,
+        timeout_keep_alive=30
+    )
 
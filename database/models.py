@@ -3,9 +3,57 @@ Database Models for Multi-Agent Fake News Detection System
 PostgreSQL and Neo4j schemas
 """
 from datetime import datetime
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, Tuple
+from dataclasses import dataclass
 import json
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from psycopg.types.json import Jsonb
+    PSYCOPG_AVAILABLE = True
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+
+
+def _dumps_json_bytes(value: Any) -> bytes:
+    """UTF-8 JSON for a JSONB column (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass  # e.g. non-str keys; stdlib json handles them
+    return json.dumps(value).encode("utf-8")
+
+
+def _jsonb_param(value: Any) -> Any:
+    """
+    Query parameter for a JSONB column. With psycopg 3 the dict is handed to
+    its Jsonb adapter, which sends the orjson bytes as they are (no str
+    round-trip); otherwise (psycopg2) it is passed as JSON text.
+    """
+    if not isinstance(value, dict):
+        return value  # already JSON text, or None
+    if PSYCOPG_AVAILABLE:
+        return Jsonb(value, dumps=_dumps_json_bytes)
+    return _dumps_json_bytes(value).decode("utf-8")
+
+
+def _db_params(data: dict, jsonb_fields: Tuple[str, ...]) -> dict:
+    """Column values for an INSERT, JSONB columns adapted"""
+    for name in jsonb_fields:
+        data[name] = _jsonb_param(data[name])
+    return data
+
+
+def _fields_dict(obj) -> dict:
+    """Top-level fields of a dataclass instance (no recursive copy like asdict)"""
+    return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
 
 
 @dataclass
@@ -22,7 +70,7 @@ class NewsItem:
     updated_at: Optional[datetime] = None
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return _fields_dict(self)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'NewsItem':
@@ -41,9 +89,10 @@ class AnalysisResult:
     created_at: Optional[datetime] = None
     
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['result_data'] = json.dumps(self.result_data) if isinstance(self.result_data, dict) else self.result_data
-        return data
+        return _fields_dict(self)
+    
+    def to_db_params(self) -> dict:
+        return _db_params(self.to_dict(), ('result_data',))
     
     @classmethod
     def from_dict(cls, data: dict) -> 'AnalysisResult':
@@ -67,11 +116,13 @@ class Verdict:
     created_at: Optional[datetime] = None
     
     def to_dict(self) -> dict:
-        data = asdict(self)
+        data = _fields_dict(self)
         data['confidence_interval'] = list(self.confidence_interval)
-        data['criteria_scores'] = json.dumps(self.criteria_scores) if isinstance(self.criteria_scores, dict) else self.criteria_scores
         return data
     
+    def to_db_params(self) -> dict:
+        return _db_params(self.to_dict(), ('criteria_scores',))
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'Verdict':
         if isinstance(data.get('confidence_interval'), list):
@@ -93,10 +144,10 @@ class Correction:
     created_at: Optional[datetime] = None
     
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['accurate_information'] = json.dumps(self.accurate_information) if isinstance(self.accurate_information, dict) else self.accurate_information
-        data['educational_content'] = json.dumps(self.educational_content) if isinstance(self.educational_content, dict) else self.educational_content
-        return data
+        return _fields_dict(self)
+    
+    def to_db_params(self) -> dict:
+        return _db_params(self.to_dict(), ('accurate_information', 'educational_content'))
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Correction':
@@ -108,6 +159,28 @@ class Correction:
 
 
 # Neo4j Graph Models (for source relationships)
+# Queries are constant strings with $parameters so Neo4j reuses the cached
+# plan; run them with session.run(query, **params)
+
+# Relationship types can't be parameters in Cypher; only plain upper-case
+# identifiers (e.g. CITES, SAME_OWNER) are interpolated
+_RELATIONSHIP_TYPE_RE = re.compile(r"[A-Z][A-Z0-9_]*")
+
+_SOURCE_NODE_CYPHER = """
+        MERGE (s:Source {domain: $domain})
+        SET s.credibility_score = $score,
+            s.source_type = $stype
+        RETURN s
+        """
+
+_RELATIONSHIP_CYPHER = """
+        MATCH (s1:Source {{domain: $source_domain}})
+        MATCH (s2:Source {{domain: $target_domain}})
+        MERGE (s1)-[r:{relationship_type}]->(s2)
+        RETURN r
+        """
+
+
 class SourceNode:
     """Neo4j node for sources"""
     def __init__(self, domain: str, credibility_score: float, source_type: str):
@@ -115,13 +188,12 @@ class SourceNode:
         self.credibility_score = credibility_score
         self.source_type = source_type
     
-    def to_cypher(self) -> str:
-        return f"""
-        MERGE (s:Source {{domain: '{self.domain}'}})
-        SET s.credibility_score = {self.credibility_score},
-            s.source_type = '{self.source_type}'
-        RETURN s
-        """
+    def to_cypher(self) -> Tuple[str, Dict[str, Any]]:
+        return _SOURCE_NODE_CYPHER, {
+            "domain": self.domain,
+            "score": self.credibility_score,
+            "stype": self.source_type
+        }
 
 
 class Relationship:
@@ -131,13 +203,14 @@ class Relationship:
         self.target_domain = target_domain
         self.relationship_type = relationship_type
     
-    def to_cypher(self) -> str:
-        return f"""
-        MATCH (s1:Source {{domain: '{self.source_domain}'}})
-        MATCH (s2:Source {{domain: '{self.target_domain}'}})
-        MERGE (s1)-[r:{self.relationship_type}]->(s2)
-        RETURN r
-        """
+    def to_cypher(self) -> Tuple[str, Dict[str, Any]]:
+        if not _RELATIONSHIP_TYPE_RE.fullmatch(self.relationship_type):
+            raise ValueError(f"Invalid relationship type: {self.relationship_type!r}")
+        query = _RELATIONSHIP_CYPHER.format(relationship_type=self.relationship_type)
+        return query, {
+            "source_domain": self.source_domain,
+            "target_domain": self.target_domain
+        }
 
 
 # SQL Schema (PostgreSQL)
@@ -2,11 +2,182 @@
 Fact-Check Detector
 Detects fact-check websites and extracts their ratings
 """
+import hashlib
+import json
 import re
-from typing import Dict, Any, Optional, Tuple
-from urllib.parse import urlparse
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Host part of a URL (scheme optional, userinfo and port skipped) - a single
+# match instead of a full urlparse
+_HOST_RE = re.compile(r"(?:[A-Za-z][A-Za-z0-9+.\-]*:)?//(?:[^/?#]*@)?([^/?#:]*)")
+# Cleaned up as urlparse does: leading C0 controls/spaces stripped, tab/CR/LF removed
+_URL_LEADING_JUNK = "".join(map(chr, range(0x21)))
+_URL_REMOVED_CHARS = str.maketrans("", "", "\t\r\n")
+# Compiled once; used on every fact-check page
+_FALSE_CLASS_RE = re.compile(r'class=["\'][^"\']*false[^"\']*["\']', re.IGNORECASE)
+_FALSE_OR_RATING_CLASS_RE = re.compile(r"false|rating", re.I)
+_METER_CLASS_RE = re.compile(r"meter|rating|truth", re.I)
+_RATING_CLASS_RE = re.compile(r"rating|verdict|meter|truth", re.I)
+# '"false"' in html.lower() without lowercasing the whole page (ASCII folding
+# is enough: no other character lowercases to these letters)
+_QUOTED_FALSE_RE = re.compile(r'"false"', re.I | re.A)
+# PolitiFact rating phrases, in order of specificity
+_POLITIFACT_RATING_KEYWORDS = (
+    ("pants on fire", "Pants on Fire"),
+    ("mostly false", "Mostly False"),
+    ("half true", "Half True"),
+    ("mostly true", "Mostly True"),
+    ("false", "False"),
+    ("true", "True")
+)
+# Phrases containing "false"/"true" (offset of that word): absent word means
+# absent phrase, otherwise the phrase can't start before that word's first match
+_RATING_PHRASE_ANCHORS = {
+    "mostly false": ("false", 7),
+    "half true": ("true", 5),
+    "mostly true": ("true", 7)
+}
+# Words that put a rating match in a rating context (checked around it)
+_RATING_WORDS = ("rating", "verdict", "meter", "truth")
+_HTML_CONTEXT_WORDS = _RATING_WORDS + ("fact", "check")
+_TEXT_CONTEXT_WORDS = _HTML_CONTEXT_WORDS + ("politifact", "rated")
+_FALSE_CONTEXT_WORDS = _TEXT_CONTEXT_WORDS + ("class", "span")
+# Known rating names, in the priority order each lookup uses; (lowercased,
+# canonical) pairs for the case-insensitive ones
+_ELEMENT_RATINGS = tuple(
+    (rating.lower(), rating)
+    for rating in ("True", "False", "Pants on Fire", "Mostly True", "Mostly False", "Half True", "Mixture", "Unproven")
+)
+_TEXT_RATINGS = ("Pants on Fire", "Mostly False", "Half True", "Mostly True", "False", "True")
+_CLEANUP_RATINGS = tuple(
+    (rating.lower(), rating)
+    for rating in ("True", "Mostly True", "Half True", "Mostly False", "False", "Pants on Fire")
+)
+# JSON-LD blocks (schema.org ClaimReview carries the site's own rating)
+_LD_JSON_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+# Last resort: "false" near rating-related keywords
+_FALSE_RATING_CONTEXT_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:rating|verdict|meter|truth)[^>]*false',
+        r'false[^>]*(?:rating|verdict|meter|truth)',
+        r'class=["\'][^"\']*false[^"\']*["\']',
+        r'data-rating=["\']false["\']'
+    )
+]
+
+# Extraction results by (url, blake2b of the page); pages are re-checked often
+RESULT_CACHE_SIZE = 4096
+# URL -> fact-check domain lookups (the same URLs are checked repeatedly)
+DOMAIN_CACHE_SIZE = 8192
+_result_cache: "OrderedDict[tuple, Optional[tuple]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+_MISSING = object()
+
+
+def _page_key(url: str, html_content: str) -> tuple:
+    return (url, hashlib.blake2b(html_content.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+
+
+def _claim_review_rating(html_content: str) -> Optional[str]:
+    """reviewRating.alternateName of the first ClaimReview in the page's JSON-LD"""
+    for match in _LD_JSON_RE.finditer(html_content):
+        try:
+            data = orjson.loads(match.group(1)) if ORJSON_AVAILABLE else json.loads(match.group(1))
+        except ValueError:
+            continue
+        # A single object, a list of them, or an {"@graph": [...]} container
+        if isinstance(data, dict):
+            data = data.get("@graph", [data])
+        if not isinstance(data, list):
+            continue
+        for obj in data:
+            if not isinstance(obj, dict):
+                continue
+            types = obj.get("@type")
+            if types != "ClaimReview" and not (isinstance(types, list) and "ClaimReview" in types):
+                continue
+            review_rating = obj.get("reviewRating")
+            if isinstance(review_rating, dict):
+                rating = review_rating.get("alternateName")
+                if isinstance(rating, str) and rating.strip():
+                    return rating.strip()
+    return None
+
+
+class _SoupPage:
+    """Parsed page (BeautifulSoup, html.parser) as used by extract_fact_check_result"""
+    
+    def __init__(self, html_content: str):
+        self._soup = BeautifulSoup(html_content, "html.parser")
+        self._text: Optional[str] = None
+    
+    def text(self) -> str:
+        """Text of the whole document (extracted once per page)"""
+        if self._text is None:
+            self._text = self._extract_text()
+        return self._text
+    
+    def _extract_text(self) -> str:
+        return self._soup.get_text()
+    
+    def elements_with_class(self, class_re) -> Iterator[Tuple[str, str]]:
+        """(class attribute, stripped text) of elements whose class matches class_re"""
+        for elem in self._soup.find_all(class_=class_re):
+            yield " ".join(elem.get("class", [])), elem.get_text(strip=True)
+    
+    def tag_texts(self, names: List[str], strip: bool) -> Iterator[str]:
+        """Texts of the given tags, in document order"""
+        for tag in self._soup.find_all(names):
+            yield tag.get_text(strip=strip)
+
+
+class _LexborPage(_SoupPage):
+    """Same view backed by selectolax's lexbor (C) parser"""
+    
+    def __init__(self, html_content: str):
+        self._tree = LexborHTMLParser(html_content)
+        # BeautifulSoup's get_text() leaves script/style contents out
+        self._tree.strip_tags(["script", "style"])
+        self._text: Optional[str] = None
+    
+    def _extract_text(self) -> str:
+        root = self._tree.root
+        return root.text() if root is not None else ""
+    
+    def elements_with_class(self, class_re) -> Iterator[Tuple[str, str]]:
+        for node in self._tree.css("[class]"):
+            classes = node.attributes.get("class") or ""
+            if class_re.search(classes):
+                yield classes, node.text(strip=True)
+    
+    def tag_texts(self, names: List[str], strip: bool) -> Iterator[str]:
+        for node in self._tree.css(", ".join(names)):
+            yield node.text(strip=strip)
+
+
+_Page = _LexborPage if SELECTOLAX_AVAILABLE else _SoupPage
+
 
 class FactCheckDetector:
     """
@@ -60,19 +231,54 @@ class FactCheckDetector:
         },
     }
     
+    # rating_patterns of each site, compiled
+    _RATING_PATTERN_RES = {
+        domain: [re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in config["rating_patterns"]]
+        for domain, config in FACT_CHECK_DOMAINS.items()
+    }
+    # Lowercased (false, true, unsure) ratings of each site, for the verdict mapping
+    _VERDICT_RATINGS = {
+        domain: tuple(
+            tuple(rating.lower() for rating in config[key])
+            for key in ("false_ratings", "true_ratings", "unsure_ratings")
+        )
+        for domain, config in FACT_CHECK_DOMAINS.items()
+    }
+    # ".politifact.com", ... - subdomains of the fact-check sites
+    _SUBDOMAIN_SUFFIXES = tuple("." + domain for domain in FACT_CHECK_DOMAINS)
+    
     def __init__(self):
         pass
     
+    @classmethod
+    @lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+    def _match_domain(cls, url: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(fact-check domain, site config) if the URL's host is that site or one of its subdomains"""
+        url = url.lstrip(_URL_LEADING_JUNK)
+        if "\t" in url or "\r" in url or "\n" in url:
+            url = url.translate(_URL_REMOVED_CHARS)
+        match = _HOST_RE.match(url)
+        if match is None:
+            return None
+        # A trailing dot is the same host
+        host = match.group(1).rstrip(".").lower()
+        site_config = cls.FACT_CHECK_DOMAINS.get(host)
+        if site_config is not None:
+            return host, site_config
+        # Most URLs aren't fact-check sites: one C-level endswith rejects them
+        if not host.endswith(cls._SUBDOMAIN_SUFFIXES):
+            return None
+        # Subdomain: walk up to the registered domain (www.snopes.com -> snopes.com)
+        while host:
+            host = host.partition(".")[2]
+            site_config = cls.FACT_CHECK_DOMAINS.get(host)
+            if site_config is not None:
+                return host, site_config
+        return None
+    
     def is_fact_check_site(self, url: str) -> bool:
         """Check if URL is from a fact-check website"""
-        try:
-            domain = urlparse(url).netloc.lower()
-            for fact_check_domain in self.FACT_CHECK_DOMAINS.keys():
-                if fact_check_domain in domain:
-                    return True
-            return False
-        except Exception:
-            return False
+        return self._match_domain(url) is not None
     
     def extract_fact_check_result(self, url: str, html_content: str) -> Optional[Dict[str, Any]]:
         """
@@ -87,176 +293,75 @@ class FactCheckDetector:
                 "confidence": 0.95
             }
         """
-        if not self.is_fact_check_site(url):
+        match = self._match_domain(url)
+        if match is None:
             return None
         
+        # Same page seen before: skip parsing and scanning entirely
+        key = _page_key(url, html_content)
+        with _result_cache_lock:
+            cached = _result_cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                _result_cache.move_to_end(key)
+        if cached is _MISSING:
+            result = self._extract(url, html_content, *match)
+            # Stored frozen (items tuple) so callers can't mutate cached results
+            cached = tuple(result.items()) if result is not None else None
+            with _result_cache_lock:
+                _result_cache[key] = cached
+                _result_cache.move_to_end(key)
+                if len(_result_cache) > RESULT_CACHE_SIZE:
+                    _result_cache.popitem(last=False)
+        
+        return dict(cached) if cached is not None else None
+    
+    def _extract(
+        self,
+        url: str,
+        html_content: str,
+        fact_check_domain: str,
+        site_config: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Uncached extraction (parses and scans the page)"""
         try:
-            domain = urlparse(url).netloc.lower()
-            site_config = None
+            rating_pattern_res = self._RATING_PATTERN_RES[fact_check_domain]
             
-            for fact_check_domain, config in self.FACT_CHECK_DOMAINS.items():
-                if fact_check_domain in domain:
-                    site_config = config
-                    break
+            # schema.org ClaimReview markup states the rating directly
+            rating = _claim_review_rating(html_content)
             
-            if not site_config:
-                return None
-            
-            # Try BeautifulSoup parsing first (more reliable)
-            rating = None
-            try:
-                soup = BeautifulSoup(html_content, "html.parser")
-                
-                # PolitiFact specific: look for meter/rating classes
-                if "politifact" in domain:
-                    # First, check page text for rating keywords (most reliable)
-                    page_text_lower = soup.get_text().lower()
-                    
-                    # Check in order of specificity
-                    rating_keywords = [
-                        ("pants on fire", "Pants on Fire"),
-                        ("mostly false", "Mostly False"),
-                        ("half true", "Half True"),
-                        ("mostly true", "Mostly True"),
-                        ("false", "False"),
-                        ("true", "True")
-                    ]
-                    
-                    # First, check for explicit "false false" pattern (common in PolitiFact HTML)
-                    if "false false" in page_text_lower or '"false"' in html_content.lower():
-                        # Check if it's in a rating context
-                        false_idx = page_text_lower.find("false")
-                        if false_idx >= 0:
-                            context = page_text_lower[max(0, false_idx-100):min(len(page_text_lower), false_idx+100)]
-                            if any(word in context for word in ["rating", "verdict", "meter", "truth", "fact", "check", "politifact", "rated", "class", "span"]):
-                                rating = "False"
-                    
-                    # If not found, try keyword matching
-                    if not rating:
-                        for keyword, rating_value in rating_keywords:
-                            if keyword in page_text_lower:
-                                # Verify it's in a relevant context
-                                idx = page_text_lower.find(keyword)
-                                context = page_text_lower[max(0, idx-50):min(len(page_text_lower), idx+50)]
-                                # More lenient - just check if it's not in a random place
-                                if any(word in context for word in ["rating", "verdict", "meter", "truth", "fact", "check", "politifact", "rated"]):
-                                    rating = rating_value
-                                    break
-                    
-                    # Also check in specific elements (including class names)
-                    if not rating:
-                        # Check for class="false" or similar patterns
-                        false_elements = soup.find_all(class_=re.compile(r"false|rating", re.I))
-                        for elem in false_elements:
-                            classes = elem.get("class", [])
-                            if any("false" in str(c).lower() for c in classes):
-                                # Verify it's a rating element
-                                parent_text = elem.get_text(strip=True).lower()
-                                if any(word in parent_text for word in ["rating", "verdict", "meter", "truth"]):
-                                    rating = "False"
-                                    break
-                        
-                        if not rating:
-                            meter_divs = soup.find_all(class_=re.compile(r"meter|rating|truth", re.I))
-                            for div in meter_divs:
-                                text = div.get_text(strip=True).lower()
-                                for keyword, rating_value in rating_keywords:
-                                    if keyword in text:
-                                        rating = rating_value
-                                        break
-                                if rating:
-                                    break
-                    
-                    # Check h1/h2/h3 tags
-                    if not rating:
-                        for tag in soup.find_all(["h1", "h2", "h3", "title"]):
-                            text = tag.get_text(strip=True).lower()
-                            for keyword, rating_value in rating_keywords:
-                                if keyword in text:
-                                    rating = rating_value
-                                    break
-                            if rating:
-                                break
-                
-                # Generic: look for rating/verdict elements
-                if not rating:
-                    rating_elements = soup.find_all(
-                        class_=re.compile(r"rating|verdict|meter|truth", re.I)
-                    )
-                    for elem in rating_elements:
-                        text = elem.get_text(strip=True)
-                        # Check for known ratings
-                        for possible_rating in ["True", "False", "Pants on Fire", "Mostly True", "Mostly False", "Half True", "Mixture", "Unproven"]:
-                            if possible_rating.lower() in text.lower():
-                                rating = possible_rating
-                                break
-                        if rating:
-                            break
-                
-                # Fallback: search in all text (more aggressive)
-                if not rating:
-                    page_text = soup.get_text()
-                    # Look for rating in title/headings first
-                    for tag in soup.find_all(["title", "h1", "h2"]):
-                        tag_text = tag.get_text()
-                        for possible_rating in ["Pants on Fire", "Mostly False", "Half True", "Mostly True", "False", "True"]:
-                            if possible_rating in tag_text:
-                                rating = possible_rating
-                                break
-                        if rating:
-                            break
-                    
-                    # If still not found, search entire page text
-                    if not rating:
-                        for possible_rating in ["Pants on Fire", "Mostly False", "Half True", "Mostly True", "False", "True"]:
-                            if possible_rating in page_text:
-                                # Check context - but be more lenient
-                                idx = page_text.find(possible_rating)
-                                if idx >= 0:
-                                    context = page_text[max(0, idx-100):min(len(page_text), idx+100)]
-                                    # More lenient context check
-                                    if any(word in context.lower() for word in ["rating", "verdict", "meter", "truth", "rated", "fact", "check", "politifact"]):
-                                        rating = possible_rating
-                                        break
-            except Exception:
-                pass
+            # Otherwise try HTML parsing (more reliable than the regexes below)
+            if not rating:
+                rating = self._rating_from_html(html_content, fact_check_domain)
             
-            # Fallback to regex patterns if BeautifulSoup didn't work
+            # Fallback to regex patterns if parsing didn't work
             if not rating:
-                # First, try to find "false" in class attributes or data attributes
-                false_class_pattern = r'class=["\'][^"\']*false[^"\']*["\']'
-                if re.search(false_class_pattern, html_content, re.IGNORECASE):
-                    # Check context around it
-                    matches = re.finditer(false_class_pattern, html_content, re.IGNORECASE)
-                    for match in matches:
-                        context = html_content[max(0, match.start()-100):min(len(html_content), match.end()+100)]
-                        if any(word in context.lower() for word in ["rating", "verdict", "meter", "truth", "fact", "check"]):
-                            rating = "False"
-                            break
+                # First, try to find "false" in class attributes (checking the context around each)
+                for match in _FALSE_CLASS_RE.finditer(html_content):
+                    context = html_content[max(0, match.start()-100):min(len(html_content), match.end()+100)]
+                    context_lower = context.lower()
+                    if any(word in context_lower for word in _HTML_CONTEXT_WORDS):
+                        rating = "False"
+                        break
                 
                 # If still not found, try regex patterns
                 if not rating:
-                    for pattern in site_config["rating_patterns"]:
-                        matches = re.findall(pattern, html_content, re.IGNORECASE | re.DOTALL)
-                        if matches:
-                            rating = matches[0].strip()
+                    for pattern_re in rating_pattern_res:
+                        # First match only (findall would scan the whole page)
+                        match = pattern_re.search(html_content)
+                        if match:
+                            rating = match.group(1).strip()
                             # Clean up rating text
-                            for possible_rating in ["True", "Mostly True", "Half True", "Mostly False", "False", "Pants on Fire"]:
-                                if possible_rating.lower() in rating.lower():
+                            rating_lower = rating.lower()
+                            for possible_lower, possible_rating in _CLEANUP_RATINGS:
+                                if possible_lower in rating_lower:
                                     rating = possible_rating
                                     break
                             break
                 
                 # Last resort: search for "false" near rating-related keywords
                 if not rating:
-                    rating_contexts = [
-                        r'(?:rating|verdict|meter|truth)[^>]*false',
-                        r'false[^>]*(?:rating|verdict|meter|truth)',
-                        r'class=["\'][^"\']*false[^"\']*["\']',
-                        r'data-rating=["\']false["\']'
-                    ]
-                    for pattern in rating_contexts:
-                        if re.search(pattern, html_content, re.IGNORECASE):
+                    for pattern_re in _FALSE_RATING_CONTEXT_RES:
+                        if pattern_re.search(html_content):
                             rating = "False"
                             break
             
@@ -274,14 +379,16 @@ class FactCheckDetector:
             verdict = "UNSURE"
             confidence = 0.5
             
+            false_ratings, true_ratings, unsure_ratings = self._VERDICT_RATINGS[fact_check_domain]
+            
             # CRITICAL: More aggressive matching - prioritize false ratings
-            if rating and any(r.lower() in rating_lower for r in site_config["false_ratings"]):
+            if rating and any(r in rating_lower for r in false_ratings):
                 verdict = "FAKE"
                 confidence = 0.92  # Fact-check sites are highly reliable (92% = 85-95% range when scaled)
-            elif rating and any(r.lower() in rating_lower for r in site_config["true_ratings"]):
+            elif rating and any(r in rating_lower for r in true_ratings):
                 verdict = "REAL"
                 confidence = 0.92
-            elif rating and any(r.lower() in rating_lower for r in site_config["unsure_ratings"]):
+            elif rating and any(r in rating_lower for r in unsure_ratings):
                 verdict = "UNSURE"
                 confidence = 0.6
             elif rating:
@@ -309,6 +416,125 @@ class FactCheckDetector:
         except Exception as e:
             return None
     
+    def _rating_from_html(self, html_content: str, fact_check_domain: str) -> Optional[str]:
+        """Rating found by parsing the page (None if not found)"""
+        rating = None
+        try:
+            page = _Page(html_content)
+            
+            # PolitiFact specific: look for meter/rating classes
+            if fact_check_domain == "politifact.com":
+                # First, check page text for rating keywords (most reliable)
+                page_text_lower = page.text().lower()
+                
+                # First match of each word, so no word is searched twice
+                first_idx: Dict[str, int] = {}
+                
+                # First, check for explicit "false false" pattern (common in PolitiFact HTML)
+                if "false false" in page_text_lower or _QUOTED_FALSE_RE.search(html_content):
+                    # Check if it's in a rating context
+                    false_idx = first_idx["false"] = page_text_lower.find("false")
+                    if false_idx >= 0:
+                        context = page_text_lower[max(0, false_idx-100):min(len(page_text_lower), false_idx+100)]
+                        if any(word in context for word in _FALSE_CONTEXT_WORDS):
+                            rating = "False"
+                
+                # If not found, try keyword matching
+                if not rating:
+                    for keyword, rating_value in _POLITIFACT_RATING_KEYWORDS:
+                        # One scan: first occurrence (or -1)
+                        anchor = _RATING_PHRASE_ANCHORS.get(keyword)
+                        if anchor is None:
+                            idx = first_idx.get(keyword)
+                            if idx is None:
+                                idx = first_idx[keyword] = page_text_lower.find(keyword)
+                        else:
+                            word, offset = anchor
+                            word_idx = first_idx.get(word)
+                            if word_idx is None:
+                                word_idx = first_idx[word] = page_text_lower.find(word)
+                            idx = page_text_lower.find(keyword, max(0, word_idx - offset)) if word_idx >= 0 else -1
+                        if idx >= 0:
+                            # Verify it's in a relevant context
+                            context = page_text_lower[max(0, idx-50):min(len(page_text_lower), idx+50)]
+                            # More lenient - just check if it's not in a random place
+                            if any(word in context for word in _TEXT_CONTEXT_WORDS):
+                                rating = rating_value
+                                break
+                
+                # Also check in specific elements (including class names)
+                if not rating:
+                    # Check for class="false" or similar patterns
+                    for classes, elem_text in page.elements_with_class(_FALSE_OR_RATING_CLASS_RE):
+                        if "false" in classes.lower():
+                            # Verify it's a rating element
+                            parent_text = elem_text.lower()
+                            if any(word in parent_text for word in _RATING_WORDS):
+                                rating = "False"
+                                break
+                    
+                    if not rating:
+                        for _, div_text in page.elements_with_class(_METER_CLASS_RE):
+                            text = div_text.lower()
+                            for keyword, rating_value in _POLITIFACT_RATING_KEYWORDS:
+                                if keyword in text:
+                                    rating = rating_value
+                                    break
+                            if rating:
+                                break
+                
+                # Check h1/h2/h3 tags
+                if not rating:
+                    for tag_text in page.tag_texts(["h1", "h2", "h3", "title"], strip=True):
+                        text = tag_text.lower()
+                        for keyword, rating_value in _POLITIFACT_RATING_KEYWORDS:
+                            if keyword in text:
+                                rating = rating_value
+                                break
+                        if rating:
+                            break
+            
+            # Generic: look for rating/verdict elements
+            if not rating:
+                for _, text in page.elements_with_class(_RATING_CLASS_RE):
+                    # Check for known ratings
+                    text_lower = text.lower()
+                    for possible_lower, possible_rating in _ELEMENT_RATINGS:
+                        if possible_lower in text_lower:
+                            rating = possible_rating
+                            break
+                    if rating:
+                        break
+            
+            # Fallback: search in all text (more aggressive)
+            if not rating:
+                page_text = page.text()
+                # Look for rating in title/headings first
+                for tag_text in page.tag_texts(["title", "h1", "h2"], strip=False):
+                    for possible_rating in _TEXT_RATINGS:
+                        if possible_rating in tag_text:
+                            rating = possible_rating
+                            break
+                    if rating:
+                        break
+                
+                # If still not found, search entire page text
+                if not rating:
+                    for possible_rating in _TEXT_RATINGS:
+                        idx = page_text.find(possible_rating)
+                        if idx >= 0:
+                            # Check context - but be more lenient
+                            context = page_text[max(0, idx-100):min(len(page_text), idx+100)]
+                            # More lenient context check
+                            context_lower = context.lower()
+                            if any(word in context_lower for word in _TEXT_CONTEXT_WORDS):
+                                rating = possible_rating
+                                break
+        except Exception:
+            pass
+        
+        return rating
+    
     def get_fact_check_verdict(self, url: str, html_content: str) -> Optional[Tuple[str, float]]:
         """
         Quick method to get verdict and confidence
@@ -319,3 +545,13 @@ class FactCheckDetector:
             return (result["verdict"], result["confidence"])
         return None
 
+
+# Global detector instance (stateless, so one is shared by all callers)
+_detector_instance: Optional[FactCheckDetector] = None
+
+def get_fact_check_detector() -> FactCheckDetector:
+    """Get or create the global fact-check detector"""
+    global _detector_instance
+    if _detector_instance is None:
+        _detector_instance = FactCheckDetector()
+    return _detector_instance
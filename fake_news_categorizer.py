@@ -2,9 +2,98 @@
 Fake News Categorizer
 Categorizes fake news into 7 subcategories with scores
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
 import re
 
+from agents.keyword_matcher import KeywordMatcher
+
+
+# Clickbait pattern'leri (başlıkta aranır) ve puanları
+_CLICKBAIT_PATTERNS = [
+    (r"bu\s+haber\s+şok\s+edecek", 20),
+    (r"görmeniz\s+gereken", 15),
+    (r"inanamayacaksınız", 20),
+    (r"numara\s+\d+", 15),
+    (r"mutlaka\s+okuyun", 15),
+    (r"kaçırmayın", 10),
+    (r"şok\s+edici", 15),
+    (r"gizli\s+gerçek", 20)
+]
+# "son dakika" sadece düşük güvenilir kaynaklarda clickbait
+_SON_DAKIKA_PATTERN = (r"son\s+dakika", 10)
+
+# Tüm pattern'ler tek alternation'da (başlık bir kez taranır); i. grup
+# i. pattern'e karşılık gelir. Pattern'ler birbirinin eşleşmesi içinde
+# başlamadığı için her pattern ayrı ayrı aranmış gibi bulunur. Baştaki
+# lookahead, hiçbir pattern'in başlayamayacağı konumları hızlıca atlar.
+_CLICKBAIT_RE = re.compile(
+    "(?=[%s])(?:%s)" % (
+        "".join(sorted({pattern[0] for pattern, _ in _CLICKBAIT_PATTERNS + [_SON_DAKIKA_PATTERN]})),
+        "|".join(f"({pattern})" for pattern, _ in _CLICKBAIT_PATTERNS + [_SON_DAKIKA_PATTERN])
+    ),
+    re.IGNORECASE
+)
+_CLICKBAIT_PENALTIES = {
+    group: penalty
+    for group, (_, penalty) in enumerate(_CLICKBAIT_PATTERNS + [_SON_DAKIKA_PATTERN], start=1)
+}
+_SON_DAKIKA_GROUP = len(_CLICKBAIT_PATTERNS) + 1
+
+# Skorlayıcıların aradığı anahtar kelime grupları (küçük harfli metin ve
+# başlıkta); her metin tek geçişte taranır
+_KEYWORD_GROUPS = {
+    "emotional": ["şok", "skandal", "ifşa", "gizli", "yasak", "saklanan", "ifşalandı"],
+    "evidence": ["kaynak", "referans", "kanıt", "rapor", "çalışma", "araştırma"],
+    "political": ["hükümet", "parti", "iktidar", "muhalefet", "darbe", "siyaset"],
+    "outdated": ["geçen yıl", "önceki", "eski", "geçmişte", "daha önce"],
+    "propaganda_emotional": ["korku", "tehlike", "düşman", "saldırı", "tehdit"],
+    "propaganda_political": ["destek", "karşı", "yanlış", "doğru", "haklı", "haksız"],
+    "humor": ["şaka", "gırgır", "komik", "eğlenceli", "mizah", "espri"],
+    "absurd": ["uzaylı", "zombi", "büyü", "sihir"],
+    "parody": ["parodi", "taklit", "alay", "ironi", "hiciv"]
+}
+_KEYWORD_MATCHER = KeywordMatcher(_KEYWORD_GROUPS)
+
+# Çerçöp haber kelimeleri (orijinal metinde aranır)
+_JUNK_KEYWORD_MATCHER = KeywordMatcher({
+    "author": ["yazar", "muhabir"],
+    "promotional": ["tıkla", "indir", "kazan", "bedava", "ücretsiz"]
+})
+
+# Yanıltıcı istatistik pattern'leri (metinde aranır)
+_STAT_PATTERNS = [
+    re.compile(pattern)
+    for pattern in [r'%\s*\d+', r'\d+\s*%', r'\d+\s*oranında', r'\d+\s*katı']
+]
+
+# Propaganda skorundaki bağlaçlar, tam kelime olarak ("amaç", "zaman" değil).
+# Pattern literal ile başlar ki sre hızlı ön ek aramasını kullanabilsin.
+_WHOLE_WORD_PATTERNS = {
+    word: re.compile(rf"{word}\b(?<!\w{word})")
+    for word in ("ama", "ancak")
+}
+
+
+def _is_repeated_word(text: str, word: str) -> bool:
+    """Kelime metinde en az iki kez tam kelime olarak geçiyor mu"""
+    # Alt dizgi sayısı bir üst sınır; düzenli ifade ikinci eşleşmede durur
+    if text.count(word) < 2:
+        return False
+    matches = _WHOLE_WORD_PATTERNS[word].finditer(text)
+    return next(matches, None) is not None and next(matches, None) is not None
+
+
+def _headline_text_overlap(headline_lower: str, text_lower: str) -> Optional[float]:
+    """
+    Başlığın ilk 5 kelimesinin metnin ilk 30 kelimesinde geçen oranı
+    (başlık veya metin boşsa None). Sadece gereken kelimeler bölünür.
+    """
+    if not (headline_lower and text_lower):
+        return None
+    headline_words = set(headline_lower.split(maxsplit=5)[:5])
+    text_words = set(text_lower.split(maxsplit=30)[:30])
+    return len(headline_words & text_words) / len(headline_words) if headline_words else 0
+
 
 class FakeNewsCategorizer:
     """
@@ -76,33 +165,46 @@ class FakeNewsCategorizer:
         source_analysis = analyses.get("source_analysis", {})
         visual_analysis = analyses.get("visual_analysis", {})
         
+        # Anahtar kelime grupları - metin ve başlık birer kez taranır
+        text_keywords = _KEYWORD_MATCHER.match(text_lower)
+        headline_keywords = _KEYWORD_MATCHER.match(headline_lower)
+        # Başlık-metin kelime örtüşmesi (mezenformasyon ve clickbait ortak kullanır)
+        overlap = _headline_text_overlap(headline_lower, text_lower)
         
         # Calculate scores for each category
         scores = {}
         
         # Use lowercase versions for pattern matching
         scores["dezenformasyon"] = self._score_disinformation(
-            headline_lower, text_lower, textual_analysis, source_analysis, confidence
+            headline_lower, text_lower, textual_analysis, source_analysis, confidence,
+            text_keywords, headline_keywords
         )
         
         scores["mezenformasyon"] = self._score_misinformation(
-            headline_lower, text_lower, textual_analysis, source_analysis, confidence
+            headline_lower, text_lower, textual_analysis, source_analysis, confidence,
+            text_keywords, overlap
         )
         
-        scores["propaganda"] = self._score_propaganda(
-            headline_lower, text_lower, textual_analysis, source_analysis
-        )
+        # Propaganda skoru metnin kelimelerine dayanır; kelimesi olmayan
+        # (boş/sadece boşluk) metinde hesaplanamaz
+        if text_lower.strip():
+            scores["propaganda"] = self._score_propaganda(
+                headline_lower, text_lower, textual_analysis, source_analysis, text_keywords
+            )
+        else:
+            scores["propaganda"] = 0.0
         
         scores["şaka_gırgır"] = self._score_satire(
-            headline_lower, text_lower, textual_analysis
+            headline_lower, text_lower, textual_analysis, text_keywords, headline_keywords
         )
         
         scores["hiciv"] = self._score_parody(
-            headline_lower, text_lower, textual_analysis
+            headline_lower, text_lower, textual_analysis, text_keywords, headline_keywords
         )
         
         scores["tıklama_yemi"] = self._score_clickbait(
-            headline, text, textual_analysis, source_analysis  # Keep original for length checks
+            headline, text, textual_analysis, source_analysis,  # Keep original for length checks
+            overlap
         )
         
         scores["çerçöp_haber"] = self._score_junk_news(
@@ -110,27 +212,20 @@ class FakeNewsCategorizer:
         )
         
         # Find primary category (highest score)
-        primary_category = max(scores.items(), key=lambda x: x[1])[0] if scores else None
+        primary_category = max(scores, key=scores.get) if scores else None
         
         # Overall fake score calculation
         # SIMPLE AND CLEAR: Use average of top 3 categories (or all if less than 3)
         # This makes it easy for users to understand: if categories are 25%, 25%, 20%, overall = ~23%
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        
-        # Filter out zero scores for calculation
-        non_zero_scores = [(cat, score) for cat, score in sorted_scores if score > 0]
-        
-        if len(non_zero_scores) >= 3:
-            # Simple average of top 3 categories
-            top_3 = non_zero_scores[:3]
-            overall_score = sum([score for _, score in top_3]) / 3.0
-        elif len(non_zero_scores) >= 2:
-            # Average of top 2 categories
-            top_2 = non_zero_scores[:2]
-            overall_score = sum([score for _, score in top_2]) / 2.0
-        elif len(non_zero_scores) >= 1:
+        # Zero scores are left out; one sort over the remaining values
+        top_scores = sorted((score for score in scores.values() if score > 0), reverse=True)[:3]
+        
+        if len(top_scores) >= 2:
+            # Simple average of top 3 (or top 2) categories
+            overall_score = sum(top_scores) / float(len(top_scores))
+        elif top_scores:
             # Single category - use it directly
-            overall_score = non_zero_scores[0][1]
+            overall_score = top_scores[0]
         else:
             # No category scores - use default based on verdict
             overall_score = 50.0 if verdict == "FAKE" else 0.0
@@ -167,7 +262,9 @@ class FakeNewsCategorizer:
         text: str,
         textual_analysis: Dict[str, Any],
         source_analysis: Dict[str, Any],
-        confidence: float
+        confidence: float,
+        text_keywords: Dict[str, Set[str]],
+        headline_keywords: Dict[str, Set[str]]
     ) -> float:
         """Dezenformasyon skoru - kasıtlı yanlış bilgi (içeriğe göre dinamik)"""
         score = 0.0
@@ -191,8 +288,7 @@ class FakeNewsCategorizer:
             pass  # Devam et, ama daha düşük puanlar ver
         
         # Emotional manipulation indicators - textual analysis'ten al
-        emotional_words = ["şok", "skandal", "ifşa", "gizli", "yasak", "saklanan", "ifşalandı"]
-        emotional_count = sum(1 for word in emotional_words if word in headline or word in text)
+        emotional_count = len(headline_keywords["emotional"] | text_keywords["emotional"])
         
         if emotional_count > 0:
             # Textual analysis'ten duygusal manipülasyon skorunu kullan
@@ -211,8 +307,7 @@ class FakeNewsCategorizer:
                 score += (emotional_count * 8) if source_cred < 0.5 else (emotional_count * 2)
         
         # Lack of evidence - içeriğe göre kontrol
-        evidence_words = ["kaynak", "referans", "kanıt", "rapor", "çalışma", "araştırma"]
-        has_evidence = any(word in text for word in evidence_words)
+        has_evidence = bool(text_keywords["evidence"])
         
         if not has_evidence and len(text) > 300:  # Uzun metin ama kaynak yok
             score += 20 if source_cred < 0.5 else 8
@@ -225,8 +320,7 @@ class FakeNewsCategorizer:
             score += (sensational_count * 8) if source_cred < 0.5 else (sensational_count * 2)
         
         # Political/divisive content - içeriğe göre
-        political_words = ["hükümet", "parti", "iktidar", "muhalefet", "darbe", "siyaset"]
-        political_count = sum(1 for word in political_words if word in text)
+        political_count = len(text_keywords["political"])
         
         if political_count >= 3:  # Çok fazla siyasi kelime
             score += 15 if source_cred < 0.4 else 5
@@ -248,7 +342,9 @@ class FakeNewsCategorizer:
         text: str,
         textual_analysis: Dict[str, Any],
         source_analysis: Dict[str, Any],
-        confidence: float
+        confidence: float,
+        text_keywords: Dict[str, Set[str]],
+        overlap: Optional[float]
     ) -> float:
         """Mezenformasyon skoru - yanlış ama kasıtsız bilgi"""
         score = 0.0
@@ -281,16 +377,12 @@ class FakeNewsCategorizer:
                         score += min(30, len(inconsistencies) * 8)  # Max 30 puan
         
         # Outdated information - içeriğe göre kontrol
-        outdated_patterns = ["geçen yıl", "önceki", "eski", "geçmişte", "daha önce"]
-        outdated_count = sum(1 for pattern in outdated_patterns if pattern in text)
+        outdated_count = len(text_keywords["outdated"])
         if outdated_count > 0:
             score += min(20, outdated_count * 5)
         
         # Misleading statistics - içeriğe göre kontrol
-        stat_patterns = [
-            r'%\s*\d+', r'\d+\s*%', r'\d+\s*oranında', r'\d+\s*katı'
-        ]
-        stat_count = sum(1 for pattern in stat_patterns if re.search(pattern, text))
+        stat_count = sum(1 for pattern in _STAT_PATTERNS if pattern.search(text))
         if stat_count > 0:
             score += min(15, stat_count * 5)
         
@@ -304,12 +396,8 @@ class FakeNewsCategorizer:
                 score -= 10  # Yüksek güven = düşük misinformation riski
         
         # Headline-text uyumsuzluğu
-        if headline and text:
-            headline_words = set(headline.lower().split()[:5])
-            text_words = set(text.lower().split()[:30])
-            overlap = len(headline_words & text_words) / len(headline_words) if headline_words else 0
-            if overlap < 0.2:  # Başlık ve metin çok farklı
-                score += 10
+        if overlap is not None and overlap < 0.2:  # Başlık ve metin çok farklı
+            score += 10
         
         return min(100, max(0, score))
     
@@ -318,28 +406,27 @@ class FakeNewsCategorizer:
         headline: str,
         text: str,
         textual_analysis: Dict[str, Any],
-        source_analysis: Dict[str, Any]
+        source_analysis: Dict[str, Any],
+        text_keywords: Dict[str, Set[str]]
     ) -> float:
         """Propaganda skoru"""
         score = 0.0
         
         # One-sided narrative
-        if text.count("ama") < 2 and text.count("ancak") < 2:
+        if not (_is_repeated_word(text, "ama") or _is_repeated_word(text, "ancak")):
             score += 20
         
         # Repetitive messaging
         words = text.split()
-        if len(set(words)) / len(words) < 0.3:  # Low vocabulary diversity
+        if words and len(set(words)) / len(words) < 0.3:  # Low vocabulary diversity
             score += 15
         
         # Emotional appeals
-        emotional = ["korku", "tehlike", "düşman", "saldırı", "tehdit"]
-        if sum(1 for word in emotional if word in text) >= 2:
+        if len(text_keywords["propaganda_emotional"]) >= 2:
             score += 25
         
         # Political alignment
-        political = ["destek", "karşı", "yanlış", "doğru", "haklı", "haksız"]
-        if sum(1 for word in political if word in text) >= 3:
+        if len(text_keywords["propaganda_political"]) >= 3:
             score += 20
         
         return min(100, score)
@@ -348,14 +435,15 @@ class FakeNewsCategorizer:
         self,
         headline: str,
         text: str,
-        textual_analysis: Dict[str, Any]
+        textual_analysis: Dict[str, Any],
+        text_keywords: Dict[str, Set[str]],
+        headline_keywords: Dict[str, Set[str]]
     ) -> float:
         """Şaka/Gırgır skoru"""
         score = 0.0
         
         # Humor indicators
-        humor_words = ["şaka", "gırgır", "komik", "eğlenceli", "mizah", "espri"]
-        if any(word in headline or word in text for word in humor_words):
+        if headline_keywords["humor"] or text_keywords["humor"]:
             score += 40
         
         # Exaggeration
@@ -363,8 +451,7 @@ class FakeNewsCategorizer:
             score += 20
         
         # Absurd claims
-        absurd = ["uzaylı", "zombi", "büyü", "sihir"]
-        if any(word in text for word in absurd):
+        if text_keywords["absurd"]:
             score += 30
         
         # Emoji usage (if text contains emojis)
@@ -377,14 +464,15 @@ class FakeNewsCategorizer:
         self,
         headline: str,
         text: str,
-        textual_analysis: Dict[str, Any]
+        textual_analysis: Dict[str, Any],
+        text_keywords: Dict[str, Set[str]],
+        headline_keywords: Dict[str, Set[str]]
     ) -> float:
         """Hiciv skoru"""
         score = 0.0
         
         # Parody indicators
-        parody_words = ["parodi", "taklit", "alay", "ironi", "hiciv"]
-        if any(word in headline or word in text for word in parody_words):
+        if headline_keywords["parody"] or text_keywords["parody"]:
             score += 50
         
         # Known parody sites
@@ -402,7 +490,8 @@ class FakeNewsCategorizer:
         headline: str,
         text: str,
         textual_analysis: Dict[str, Any],
-        source_analysis: Dict[str, Any] = None
+        source_analysis: Dict[str, Any] = None,
+        overlap: Optional[float] = None
     ) -> float:
         """Tıklama yemi skoru - İçeriğe göre dinamik hesaplama"""
         score = 0.0
@@ -412,30 +501,19 @@ class FakeNewsCategorizer:
         if source_analysis:
             source_cred = source_analysis.get("source_info", {}).get("credibility_score", 0.5)
         
-        # Clickbait pattern'leri - içeriğe göre dinamik
-        clickbait_patterns = [
-            (r"bu\s+haber\s+şok\s+edecek", 20),
-            (r"görmeniz\s+gereken", 15),
-            (r"inanamayacaksınız", 20),
-            (r"numara\s+\d+", 15),
-            (r"mutlaka\s+okuyun", 15),
-            (r"kaçırmayın", 10),
-            (r"şok\s+edici", 15),
-            (r"gizli\s+gerçek", 20)
-        ]
+        # Clickbait pattern'leri - içeriğe göre dinamik (her pattern bir kez sayılır)
+        matched_groups = {match.lastindex for match in _CLICKBAIT_RE.finditer(headline)}
         
         # "son dakika" sadece düşük güvenilir kaynaklarda clickbait
-        if source_cred < 0.7:
-            clickbait_patterns.append((r"son\s+dakika", 10))
-        
-        # Pattern matching - her pattern için ayrı kontrol
-        matched_patterns = 0
-        for pattern, penalty in clickbait_patterns:
-            if re.search(pattern, headline, re.IGNORECASE):
-                # Güvenilir kaynaklarda daha az puan
-                adjusted_penalty = int(penalty * 0.6) if source_cred >= 0.7 else penalty
-                score += adjusted_penalty
-                matched_patterns += 1
+        if source_cred >= 0.7:
+            matched_groups.discard(_SON_DAKIKA_GROUP)
+        
+        for group in matched_groups:
+            penalty = _CLICKBAIT_PENALTIES[group]
+            # Güvenilir kaynaklarda daha az puan
+            adjusted_penalty = int(penalty * 0.6) if source_cred >= 0.7 else penalty
+            score += adjusted_penalty
+        matched_patterns = len(matched_groups)
         
         # Çok fazla pattern eşleşirse ekstra puan
         if matched_patterns >= 2:
@@ -449,11 +527,7 @@ class FakeNewsCategorizer:
             score += penalty if source_cred < 0.7 else int(penalty * 0.5)
         
         # Headline-text mismatch (içeriğe göre dinamik)
-        if headline and text:
-            headline_words = set(headline.lower().split()[:5])
-            text_words = set(text.lower().split()[:30])  # Daha fazla kelime kontrolü
-            overlap = len(headline_words & text_words) / len(headline_words) if headline_words else 0
-            
+        if overlap is not None:
             if overlap < 0.2:  # Çok düşük overlap
                 penalty = 25 if source_cred < 0.7 else 15
                 score += penalty
@@ -502,6 +576,7 @@ class FakeNewsCategorizer:
     ) -> float:
         """Çerçöp haber skoru"""
         score = 0.0
+        junk_keywords = _JUNK_KEYWORD_MATCHER.match(text)
         
         # Low quality indicators
         source_cred = source_analysis.get("source_info", {}).get("credibility_score", 0.5)
@@ -517,12 +592,11 @@ class FakeNewsCategorizer:
             score += 20
         
         # No author information
-        if "yazar" not in text and "muhabir" not in text:
+        if not junk_keywords["author"]:
             score += 15
         
         # Excessive ads/promotional content
-        promotional = ["tıkla", "indir", "kazan", "bedava", "ücretsiz"]
-        if sum(1 for word in promotional if word in text) >= 2:
+        if len(junk_keywords["promotional"]) >= 2:
             score += 20
         
         return min(100, score)
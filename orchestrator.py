@@ -50,6 +50,117 @@ class Orchestrator:
         Main pipeline execution
         Processes a news item through all phases
         """
+        pipeline = self._pipeline(item)
+        try:
+            cleaned_item = next(pipeline)
+        except StopIteration as stop:
+            return stop.value  # early exit (spam)
+        
+        try:
+            content = self._analyze_content(cleaned_item)
+        except Exception as e:
+            return self._resume(pipeline, error=e)
+        return self._resume(pipeline, content)
+    
+    def process_news_items_batch(
+        self,
+        items: List[Dict[str, Any]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Process several news items (results keep the input order).
+        Content analysis (VVA/TCA) runs once for the whole batch through the
+        agents' batch paths; the other phases run per item.
+        With return_exceptions=True a failed item's exception is returned in
+        its slot, otherwise the first failure is raised after the batch.
+        """
+        results: List[Any] = [None] * len(items)
+        waiting = []  # (index, pipeline, cleaned item) paused before content analysis
+        for index, item in enumerate(items):
+            pipeline = self._pipeline(item)
+            try:
+                waiting.append((index, pipeline, next(pipeline)))
+            except StopIteration as stop:
+                results[index] = stop.value  # early exit (spam)
+            except Exception as e:
+                results[index] = e
+        
+        contents = None
+        if waiting:
+            cleaned_items = [cleaned_item for _, _, cleaned_item in waiting]
+            try:
+                content_start = time.time()
+                visual_results = self._timed_batch("VVA", self.vva.process_batch, cleaned_items)
+                textual_results = self._timed_batch("TCA", self.tca.process_batch, cleaned_items)
+                # Phase time per item: its share of the batch
+                content_time = (time.time() - content_start) / len(waiting)
+                contents = [
+                    (visual_result, textual_result, content_time)
+                    for visual_result, textual_result in zip(visual_results, textual_results)
+                ]
+            except Exception:
+                contents = None  # fall back to per-item analysis (and per-item errors)
+        
+        for position, (index, pipeline, cleaned_item) in enumerate(waiting):
+            try:
+                if contents is not None:
+                    results[index] = self._resume(pipeline, contents[position])
+                    continue
+                try:
+                    content = self._analyze_content(cleaned_item)
+                except Exception as e:
+                    results[index] = self._resume(pipeline, error=e)
+                else:
+                    results[index] = self._resume(pipeline, content)
+            except Exception as e:
+                results[index] = e
+        
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+    
+    def _analyze_content(self, cleaned_item: Dict[str, Any]) -> tuple:
+        """Phase 2 for a single item: (visual_result, textual_result, phase time)"""
+        phase_start = time.time()
+        agent_start = time.time()
+        visual_result = self.vva.process(cleaned_item)
+        self.metrics.record_agent_call("VVA", time.time() - agent_start, True)
+        
+        agent_start = time.time()
+        textual_result = self.tca.process(cleaned_item)
+        self.metrics.record_agent_call("TCA", time.time() - agent_start, True)
+        return visual_result, textual_result, time.time() - phase_start
+    
+    def _timed_batch(self, agent_name: str, process_batch, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run an agent's batch method; the call time is recorded per item (batch time / size)"""
+        agent_start = time.time()
+        results = process_batch(items)
+        per_item = (time.time() - agent_start) / len(items)
+        for _ in items:
+            self.metrics.record_agent_call(agent_name, per_item, True)
+        return results
+    
+    @staticmethod
+    def _resume(pipeline, content: Optional[tuple] = None, error: Optional[Exception] = None) -> Dict[str, Any]:
+        """Continue a paused _pipeline with the content analysis results (or its error)"""
+        try:
+            if error is not None:
+                pipeline.throw(error)
+            else:
+                pipeline.send(content)
+        except StopIteration as stop:
+            return stop.value
+        raise RuntimeError("pipeline paused more than once")
+    
+    def _pipeline(self, item: Optional[Dict[str, Any]]):
+        """
+        Pipeline body as a generator: pauses once, yielding the cleaned item,
+        and expects (visual_result, textual_result, phase time) to be sent back so that
+        content analysis can be done per item or for a whole batch.
+        The final result is the generator's return value.
+        """
         start_time = time.time()
         phase_times: Dict[str, float] = {}
         item_id = item.get("id", "unknown") if item else "unknown"
@@ -92,17 +203,8 @@ class Orchestrator:
             
             cleaned_item = preprocessed.get("cleaned_data", item)
             
-            # Phase 2: Content Analysis (Parallel)
-            phase_start = time.time()
-            agent_start = time.time()
-            visual_result = self.vva.process(cleaned_item)
-            self.metrics.record_agent_call("VVA", time.time() - agent_start, True)
-            
-            agent_start = time.time()
-            textual_result = self.tca.process(cleaned_item)
-            self.metrics.record_agent_call("TCA", time.time() - agent_start, True)
-            
-            phase_times["content_analysis"] = time.time() - phase_start
+            # Phase 2: Content Analysis (done by the caller, see process_news_item)
+            visual_result, textual_result, phase_times["content_analysis"] = yield cleaned_item
             self.metrics.record_phase_execution("content_analysis", phase_times["content_analysis"])
             
             # Phase 3: Debate Process
@@ -246,7 +348,12 @@ class Orchestrator:
     def get_pipeline_statistics(self) -> Dict[str, Any]:
         """Get pipeline statistics"""
         if not self.pipeline_results:
-            return {"total_processed": 0}
+            return {
+                "total_processed": 0,
+                "verdict_distribution": {},
+                "average_processing_time": 0.0,
+                "last_processed": None
+            }
         
         total = len(self.pipeline_results)
         verdicts = {}
@@ -3,83 +3,142 @@ Simple file-based storage for recent checks and statistics
 """
 import json
 import os
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Feedbacks live in an append-only JSON Lines file next to the checks file
+FEEDBACK_FILE_NAME = "feedbacks.jsonl"
+# Only the most recent feedbacks are kept
+MAX_FEEDBACKS = 500
+
+
+def _dump_line(record: Dict[str, Any]) -> bytes:
+    """One JSON Lines record"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _load_line(line: bytes) -> Dict[str, Any]:
+    return orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+
 
 class NewsStorage:
     """Simple JSON-based storage for news checks"""
     
     def __init__(self, storage_file: str = "logs/news_checks.json"):
         self.storage_file = storage_file
+        self.feedback_file = os.path.join(os.path.dirname(storage_file), FEEDBACK_FILE_NAME)
+        # Parsed feedbacks (last MAX_FEEDBACKS) and the feedback file version
+        # (mtime, size) they match; lines in the file (compacted when it grows)
+        self._feedbacks: Optional[List[Dict[str, Any]]] = None
+        self._feedbacks_version: Optional[Tuple[int, int]] = None
+        self._feedback_lines = 0
+        # add_check runs on worker threads (background tasks); serializes
+        # its load -> modify -> save of the checks file
+        self._checks_lock = threading.Lock()
         self._ensure_storage_exists()
+        self._migrate_feedbacks()
     
     def _ensure_storage_exists(self):
         """Create storage file if it doesn't exist"""
         os.makedirs(os.path.dirname(self.storage_file), exist_ok=True)
         if not os.path.exists(self.storage_file):
             with open(self.storage_file, "w", encoding="utf-8") as f:
-                json.dump({"checks": [], "url_counts": {}, "feedbacks": []}, f, ensure_ascii=False)
+                json.dump({"checks": [], "url_counts": {}}, f, ensure_ascii=False)
+    
+    def _migrate_feedbacks(self):
+        """One-time move of feedbacks stored in the checks file (older layout) to the JSONL file"""
+        if os.path.exists(self.feedback_file):
+            return
+        data = self._load()
+        legacy_feedbacks = data.pop("feedbacks", None) or []
+        self._write_feedbacks(legacy_feedbacks[-MAX_FEEDBACKS:])
+        if legacy_feedbacks:
+            self._save(data)
     
     def _load(self) -> Dict[str, Any]:
         """Load data from storage"""
         try:
             with open(self.storage_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                # Ensure feedbacks key exists for backward compatibility
-                if "feedbacks" not in data:
-                    data["feedbacks"] = []
-                return data
+                return json.load(f)
         except Exception:
-            return {"checks": [], "url_counts": {}, "feedbacks": []}
+            return {"checks": [], "url_counts": {}}
     
     def _save(self, data: Dict[str, Any]):
-        """Save data to storage"""
-        with open(self.storage_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """Save data to storage (atomically: readers never see a half-written file)"""
+        payload = None
+        if ORJSON_AVAILABLE:
+            try:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                pass
+        if payload is None:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        tmp_file = self.storage_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, self.storage_file)
+    
+    def _feedback_file_version(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the feedback file, None if it doesn't exist"""
+        try:
+            st = os.stat(self.feedback_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _write_feedbacks(self, feedbacks: List[Dict[str, Any]]):
+        """Rewrite the feedback file atomically (migration / compaction)"""
+        tmp_file = self.feedback_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(b"".join(_dump_line(record) for record in feedbacks))
+        os.replace(tmp_file, self.feedback_file)
+        self._feedbacks = list(feedbacks)
+        self._feedbacks_version = self._feedback_file_version()
+        self._feedback_lines = len(feedbacks)
+    
+    def feedbacks_cached(self) -> bool:
+        """True if get_feedbacks() can answer from memory (no file read)"""
+        version = self._feedback_file_version()
+        return version is None or (self._feedbacks is not None and version == self._feedbacks_version)
+    
+    def get_feedbacks(self) -> List[Dict[str, Any]]:
+        """
+        Most recent feedbacks (up to MAX_FEEDBACKS), oldest first. Served from
+        memory; the file is re-read only when it changed on disk. Treat the
+        list as read-only.
+        """
+        version = self._feedback_file_version()
+        if version is None:
+            return []
+        if self._feedbacks is None or version != self._feedbacks_version:
+            feedbacks = []
+            with open(self.feedback_file, "rb") as f:
+                for line in f:
+                    try:
+                        feedbacks.append(_load_line(line))
+                    except ValueError:
+                        continue  # partially written line
+            self._feedbacks = feedbacks[-MAX_FEEDBACKS:]
+            self._feedbacks_version = version
+            self._feedback_lines = len(feedbacks)
+        return self._feedbacks
     
     def add_check(self, result: Dict[str, Any]):
         """Add a news check result"""
         try:
-            data = self._load()
-            
-            # Prepare check record with safe defaults
-            item = result.get("item", {})
-            check_record = {
-                "id": item.get("id") or f"check-{datetime.utcnow().isoformat().replace(':', '-')}",
-                "headline": item.get("headline", "") or item.get("title", "") or "Başlıksız",
-                "link": item.get("link", "") or item.get("url", "") or "",
-                "verdict": result.get("verdict", "UNSURE"),
-                "confidence": float(result.get("confidence", 0.0)),
-                "categories": result.get("categories", {}),
-                "primary_category": result.get("primary_category"),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            # Ensure categories is a dict (not None)
-            if not isinstance(check_record["categories"], dict):
-                check_record["categories"] = {}
-            
-            # Add to checks
-            data["checks"].append(check_record)
-            
-            # Update URL count
-            url = check_record["link"]
-            if url:
-                if url not in data["url_counts"]:
-                    data["url_counts"][url] = {
-                        "count": 0,
-                        "first_seen": check_record["timestamp"],
-                        "headline": check_record["headline"]
-                    }
-                data["url_counts"][url]["count"] += 1
-            
-            # Keep only last 1000 checks
-            if len(data["checks"]) > 1000:
-                data["checks"] = data["checks"][-1000:]
-            
-            self._save(data)
+            with self._checks_lock:
+                self._add_check(result)
         except Exception as e:
             # Log error but don't fail the request
             import logging
@@ -87,6 +146,48 @@ class NewsStorage:
             # Continue without saving - don't break the API response
             pass
     
+    def _add_check(self, result: Dict[str, Any]):
+        """add_check body (caller holds _checks_lock)"""
+        data = self._load()
+        now = datetime.utcnow().isoformat()
+        
+        # Prepare check record with safe defaults
+        item = result.get("item", {})
+        check_record = {
+            "id": item.get("id") or f"check-{now.replace(':', '-')}",
+            "headline": item.get("headline", "") or item.get("title", "") or "Başlıksız",
+            "link": item.get("link", "") or item.get("url", "") or "",
+            "verdict": result.get("verdict", "UNSURE"),
+            "confidence": float(result.get("confidence", 0.0)),
+            "categories": result.get("categories", {}),
+            "primary_category": result.get("primary_category"),
+            "timestamp": now
+        }
+        
+        # Ensure categories is a dict (not None)
+        if not isinstance(check_record["categories"], dict):
+            check_record["categories"] = {}
+        
+        # Add to checks
+        data["checks"].append(check_record)
+        
+        # Update URL count
+        url = check_record["link"]
+        if url:
+            if url not in data["url_counts"]:
+                data["url_counts"][url] = {
+                    "count": 0,
+                    "first_seen": check_record["timestamp"],
+                    "headline": check_record["headline"]
+                }
+            data["url_counts"][url]["count"] += 1
+        
+        # Keep only last 1000 checks
+        if len(data["checks"]) > 1000:
+            data["checks"] = data["checks"][-1000:]
+        
+        self._save(data)
+    
     def get_recent_checks(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get most recent checks"""
         data = self._load()
@@ -131,31 +232,56 @@ class NewsStorage:
             for url, count in sorted_urls
         ]
     
-    def add_feedback(self, item_id: str, feedback: str, timestamp: str = None) -> Dict[str, Any]:
-        """Add user feedback for a news item"""
+    def add_feedback(
+        self,
+        item_id: str,
+        feedback: str,
+        timestamp: str = None,
+        feedback_lc: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Add user feedback for a news item.
+        feedback_lc: optional lowercased copy of the text, stored alongside it
+        """
         try:
-            data = self._load()
-            
+            now = datetime.utcnow().isoformat()
             if timestamp is None:
-                timestamp = datetime.utcnow().isoformat()
+                timestamp = now
             
             feedback_record = {
-                "id": f"feedback-{datetime.utcnow().isoformat().replace(':', '-')}",
+                "id": f"feedback-{now.replace(':', '-')}",
                 "item_id": item_id,
                 "feedback": feedback,
                 "timestamp": timestamp
             }
+            if feedback_lc is not None:
+                feedback_record["feedback_lc"] = feedback_lc
             
-            # Add to feedbacks
-            if "feedbacks" not in data:
-                data["feedbacks"] = []
-            data["feedbacks"].append(feedback_record)
+            # Bring the cache up to date first (it also counts the file's lines)
+            feedbacks = self.get_feedbacks()
             
-            # Keep only last 500 feedbacks
-            if len(data["feedbacks"]) > 500:
-                data["feedbacks"] = data["feedbacks"][-500:]
+            # Append one line instead of rewriting the whole history
+            line = _dump_line(feedback_record)
+            with open(self.feedback_file, "ab+") as f:
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        # Torn last line (interrupted write): terminate it so
+                        # this record doesn't get glued onto it
+                        line = b"\n" + line
+                f.write(line)
+            feedbacks.append(feedback_record)
+            self._feedback_lines += 1
             
-            self._save(data)
+            # Keep only last MAX_FEEDBACKS feedbacks
+            if len(feedbacks) > MAX_FEEDBACKS:
+                del feedbacks[:-MAX_FEEDBACKS]
+            if self._feedback_lines > 2 * MAX_FEEDBACKS:
+                # Amortized compaction: rewrite once per MAX_FEEDBACKS appends
+                self._write_feedbacks(feedbacks)
+            else:
+                self._feedbacks = feedbacks
+                self._feedbacks_version = self._feedback_file_version()
             return feedback_record
         except Exception as e:
             import logging
@@ -0,0 +1,136 @@
+import asyncio
+import os, sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+import api
+
+
+class _OverlapProbe:
+    """Stand-in for an orchestrator call; records how many run at once"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def __call__(self, item):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        return {"item": item}
+
+
+def _run_concurrently(probe, count=8):
+    async def main():
+        return await asyncio.gather(*(api._run_pipeline(probe, i) for i in range(count)))
+    return asyncio.run(main())
+
+
+def test_pipeline_calls_do_not_overlap(monkeypatch):
+    monkeypatch.setattr(api, "PIPELINE_EXECUTOR", ThreadPoolExecutor(max_workers=1))
+    probe = _OverlapProbe()
+    assert _run_concurrently(probe) == [{"item": i} for i in range(8)]
+    assert probe.max_running == 1
+    api.PIPELINE_EXECUTOR.shutdown(wait=True)
+
+
+def test_pipeline_calls_do_not_overlap_outside_lifespan(monkeypatch):
+    # No PIPELINE_EXECUTOR: the default executor has several threads
+    monkeypatch.setattr(api, "PIPELINE_EXECUTOR", None)
+    probe = _OverlapProbe()
+    assert _run_concurrently(probe) == [{"item": i} for i in range(8)]
+    assert probe.max_running == 1
+
+
+class _FakeOrchestrator:
+    def __init__(self, batch_error=None):
+        self.batches = []
+        self.single_items = []
+        self.batch_error = batch_error
+
+    def process_news_items_batch(self, items, return_exceptions=False):
+        self.batches.append([item["id"] for item in items])
+        if self.batch_error is not None:
+            error, self.batch_error = self.batch_error, None
+            raise error
+        return [ValueError(item["id"]) if item.get("fail") else {"id": item["id"]} for item in items]
+
+    def process_news_item(self, item):
+        self.single_items.append(item["id"])
+        return {"id": item["id"]}
+
+
+def _analyze_all(monkeypatch, fake, items_per_round):
+    """Send each round of items concurrently through a running batcher"""
+    monkeypatch.setattr(api, "orchestrator", fake)
+    monkeypatch.setattr(api, "PIPELINE_EXECUTOR", None)
+    monkeypatch.setattr(api, "_analyze_queue", None)
+
+    async def main():
+        batcher = api._start_analyze_batcher()
+        try:
+            return [
+                await asyncio.gather(*(api._process_news_item_batched(item) for item in items), return_exceptions=True)
+                for items in items_per_round
+            ]
+        finally:
+            batcher.cancel()
+    return asyncio.run(main())
+
+
+def test_concurrent_requests_share_one_batch(monkeypatch):
+    fake = _FakeOrchestrator()
+    items = [{"id": i} for i in range(5)]
+    assert _analyze_all(monkeypatch, fake, [items]) == [[{"id": i} for i in range(5)]]
+    assert fake.batches == [[0, 1, 2, 3, 4]]
+    assert fake.single_items == []
+
+
+def test_failed_item_only_fails_its_own_request(monkeypatch):
+    fake = _FakeOrchestrator()
+    [results] = _analyze_all(monkeypatch, fake, [[{"id": 0}, {"id": 1, "fail": True}, {"id": 2}]])
+    assert results[0] == {"id": 0} and results[2] == {"id": 2}
+    assert isinstance(results[1], ValueError) and results[1].args == (1,)
+
+
+def test_batch_error_reaches_every_request_and_batcher_keeps_running(monkeypatch):
+    fake = _FakeOrchestrator(batch_error=RuntimeError("boom"))
+    first, second = _analyze_all(monkeypatch, fake, [[{"id": 0}, {"id": 1}], [{"id": 2}]])
+    assert all(isinstance(result, RuntimeError) for result in first)
+    assert second == [{"id": 2}]
+    assert fake.batches == [[0, 1], [2]]
+
+
+def test_without_batcher_items_are_processed_one_by_one(monkeypatch):
+    fake = _FakeOrchestrator()
+    monkeypatch.setattr(api, "orchestrator", fake)
+    monkeypatch.setattr(api, "PIPELINE_EXECUTOR", None)
+    monkeypatch.setattr(api, "_analyze_queue", None)
+    assert asyncio.run(api._process_news_item_batched({"id": 7})) == {"id": 7}
+    assert fake.single_items == [7] and fake.batches == []
+
+
+def test_feedback_learning_goes_through_the_pipeline(monkeypatch):
+    calls = []
+
+    class _Agent:
+        def __init__(self, name):
+            self.name = name
+
+        def process(self, data):
+            calls.append((self.name, threading.current_thread().name))
+
+    fake = _FakeOrchestrator()
+    fake.rla, fake.oa = _Agent("rla"), _Agent("oa")
+    monkeypatch.setattr(api, "orchestrator", fake)
+    monkeypatch.setattr(api, "PIPELINE_EXECUTOR", ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline"))
+    asyncio.run(api._process_feedback_learning("item-1", "doğru", "2024-01-01T00:00:00"))
+    api.PIPELINE_EXECUTOR.shutdown(wait=True)
+    assert [name for name, _ in calls] == ["rla", "oa"]
+    assert all(thread.startswith("pipeline") for _, thread in calls)
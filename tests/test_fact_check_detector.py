@@ -0,0 +1,59 @@
+import json
+import os, sys
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+from fact_check_detector import FactCheckDetector, _claim_review_rating
+
+
+def _ld_json(obj):
+    return '<script type="application/ld+json">' + json.dumps(obj) + '</script>'
+
+
+def test_matches_site_and_subdomains_by_host():
+    detector = FactCheckDetector()
+    assert FactCheckDetector._match_domain("https://www.politifact.com/factchecks/x")[0] == "politifact.com"
+    assert FactCheckDetector._match_domain("https://snopes.com/fact-check/x")[0] == "snopes.com"
+    # userinfo, port, case and a trailing dot don't change the host
+    assert FactCheckDetector._match_domain("http://user@WWW.Snopes.COM.:443/x")[0] == "snopes.com"
+    assert detector.is_fact_check_site("//fullfact.org/a")
+
+
+def test_lookalike_hosts_and_paths_do_not_match():
+    detector = FactCheckDetector()
+    for url in (
+        "https://notsnopes.com/x",
+        "https://politifact.com.evil.net/x",
+        "https://example.com/?ref=snopes.com",
+        "https://example.com/snopes.com/a",
+        "snopes.com/x",  # no scheme or "//": a path, like urlparse
+        "",
+    ):
+        assert not detector.is_fact_check_site(url), url
+        assert detector.extract_fact_check_result(url, "<html></html>") is None, url
+
+
+def test_claim_review_rating_takes_precedence_over_page_body():
+    detector = FactCheckDetector()
+    url = "https://www.snopes.com/fact-check/claim"
+    body = '<div class="rating-label">True</div><p>Rating: True</p>'
+    claim_review = _ld_json({"@type": "ClaimReview", "reviewRating": {"alternateName": "False"}})
+
+    result = detector.extract_fact_check_result(url, f"<html><head>{claim_review}</head><body>{body}</body></html>")
+    assert (result["rating"], result["verdict"]) == ("False", "FAKE")
+    # Without the markup the body is parsed as before
+    result = detector.extract_fact_check_result(url, f"<html><body>{body}</body></html>")
+    assert (result["rating"], result["verdict"]) == ("True", "REAL")
+
+
+def test_claim_review_rating_json_ld_shapes():
+    rating = {"reviewRating": {"alternateName": " Mostly True "}}
+    graph = {"@graph": [{"@type": "WebPage"}, {"@type": ["ClaimReview", "Thing"], **rating}]}
+    assert _claim_review_rating(_ld_json(graph)) == "Mostly True"
+    assert _claim_review_rating(_ld_json([{"@type": "Article"}, {"@type": "ClaimReview", **rating}])) == "Mostly True"
+    # Invalid blocks are skipped
+    broken = '<script type="application/ld+json">{broken</script>'
+    assert _claim_review_rating(broken + _ld_json({"@type": "ClaimReview", **rating})) == "Mostly True"
+    # Other types, or no textual rating: no shortcut
+    assert _claim_review_rating(_ld_json({"@type": "Article", **rating})) is None
+    assert _claim_review_rating(_ld_json({"@type": "ClaimReview", "reviewRating": {"ratingValue": 1}})) is None
@@ -0,0 +1,29 @@
+import os, sys
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+from fake_news_categorizer import FakeNewsCategorizer, _is_repeated_word
+
+
+def _propaganda(text):
+    item = {"headline": "Başlık", "text": text, "link": "https://example.com/a"}
+    result = FakeNewsCategorizer().categorize(item, {}, "FAKE", 0.9)
+    return result["categories"]["propaganda"]
+
+
+def test_repeated_word_counts_whole_words_only():
+    assert _is_repeated_word("ama bunu ama şunu", "ama")
+    assert _is_repeated_word("ancak, dedi. ancak!", "ancak")
+    assert not _is_repeated_word("zaman tamamen amaç ama", "ama")
+    assert not _is_repeated_word("", "ama")
+
+
+def test_words_containing_ama_do_not_count_as_contrast():
+    # "zaman", "tamamen", "amaç" used to count as "ama" (3 substring hits)
+    assert _propaganda("zaman geldi, tamamen bitti; amaç belli") == 20
+    assert _propaganda("zaman geldi ama tamamen bitti, ama amaç belli") == 0
+
+
+def test_empty_text_scores_zero_propaganda():
+    assert _propaganda("") == 0.0
+    assert _propaganda("   ") == 0.0
@@ -0,0 +1,41 @@
+import os, sys
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+from agents.keyword_matcher import KeywordMatcher
+
+
+KEYWORDS = {
+    "positive": ["good", "great", "win"],
+    "negative": ["bad", "angry", "fail"],
+    "anger": ["angry", "outrage"],
+}
+
+
+def _fallback(matcher):
+    matcher._automaton = None
+    return matcher
+
+
+def test_counts_each_keyword_once_per_tag():
+    matcher = KeywordMatcher(KEYWORDS)
+    counts = matcher.count("good good news, angry crowd, a great win")
+    assert counts == {"positive": 3, "negative": 1, "anger": 1}
+
+
+def test_matches_substrings_like_plain_in_check():
+    matcher = KeywordMatcher(KEYWORDS)
+    text = "badminton failed outrageous winner"
+    assert matcher.match(text) == _fallback(KeywordMatcher(KEYWORDS)).match(text)
+    assert matcher.count(text) == {"positive": 1, "negative": 2, "anger": 1}
+
+
+def test_empty_text_returns_all_tags():
+    assert KeywordMatcher(KEYWORDS).count("") == {"positive": 0, "negative": 0, "anger": 0}
+
+
+def test_count_many_matches_per_text_counts():
+    matcher = KeywordMatcher(KEYWORDS)
+    texts = ["good", "", "angry fail", "goo", "d win", "outrage"]
+    assert matcher.count_many(texts) == [matcher.count(t) for t in texts]
+    assert _fallback(KeywordMatcher(KEYWORDS)).count_many(texts) == matcher.count_many(texts)
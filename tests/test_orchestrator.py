@@ -0,0 +1,41 @@
+import os, sys
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+from orchestrator import Orchestrator
+
+
+def _items(count):
+    return [
+        {
+            "id": f"item-{i}",
+            "headline": f"Belediye yeni park projesini açıkladı {i}",
+            "text": "Belediye başkanı bugün yaptığı açıklamada şehir merkezine yeni bir park yapılacağını duyurdu. "
+                    f"Projenin {i + 2} yıl içinde tamamlanması bekleniyor.",
+            "link": f"https://example.com/haber-{i}"
+        }
+        for i in range(count)
+    ]
+
+
+def test_failed_batch_analysis_falls_back_to_per_item(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orchestrator = Orchestrator()
+    expected = [orchestrator.process_news_item(item)["verdict"] for item in _items(3)]
+
+    def broken_batch(items):
+        raise RuntimeError("batch failed")
+
+    per_item_calls = []
+    process = orchestrator.tca.process
+
+    def counting_process(item):
+        per_item_calls.append(item)
+        return process(item)
+
+    monkeypatch.setattr(orchestrator.tca, "process_batch", broken_batch)
+    monkeypatch.setattr(orchestrator.tca, "process", counting_process)
+    results = orchestrator.process_news_items_batch(_items(3), return_exceptions=True)
+    assert [result["status"] for result in results] == ["completed"] * 3
+    assert [result["verdict"] for result in results] == expected
+    assert len(per_item_calls) == 3
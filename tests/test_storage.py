@@ -0,0 +1,81 @@
+import json
+import os, sys
+import threading
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+import storage
+from storage import NewsStorage
+
+
+def _feedback(i):
+    return {"id": f"feedback-{i}", "item_id": f"item-{i}", "feedback": f"yorum {i}", "timestamp": "2024-01-01T00:00:00"}
+
+
+def _storage_with_legacy_feedbacks(tmp_path, feedbacks):
+    checks_file = tmp_path / "news_checks.json"
+    checks_file.write_text(json.dumps({"checks": [], "url_counts": {}, "feedbacks": feedbacks}), encoding="utf-8")
+    return NewsStorage(str(checks_file))
+
+
+def test_legacy_feedbacks_move_to_jsonl_file(tmp_path):
+    legacy = [_feedback(i) for i in range(3)]
+    store = _storage_with_legacy_feedbacks(tmp_path, legacy)
+
+    assert store.get_feedbacks() == legacy
+    assert "feedbacks" not in json.loads((tmp_path / "news_checks.json").read_text(encoding="utf-8"))
+    lines = (tmp_path / storage.FEEDBACK_FILE_NAME).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == legacy
+    # Already migrated: a new instance reads the same records
+    assert NewsStorage(str(tmp_path / "news_checks.json")).get_feedbacks() == legacy
+
+
+def test_migration_keeps_only_the_most_recent(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "MAX_FEEDBACKS", 2)
+    legacy = [_feedback(i) for i in range(5)]
+    assert _storage_with_legacy_feedbacks(tmp_path, legacy).get_feedbacks() == legacy[-2:]
+
+
+def test_added_feedbacks_are_appended_and_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "MAX_FEEDBACKS", 3)
+    store = _storage_with_legacy_feedbacks(tmp_path, [])
+    feedback_file = tmp_path / storage.FEEDBACK_FILE_NAME
+
+    records = [store.add_feedback(f"item-{i}", f"yorum {i}") for i in range(6)]
+    # Appended, not rewritten, until the file holds 2 * MAX_FEEDBACKS lines
+    assert len(feedback_file.read_text(encoding="utf-8").splitlines()) == 6
+    assert store.get_feedbacks() == records[-3:]
+
+    records.append(store.add_feedback("item-6", "yorum 6"))
+    assert len(feedback_file.read_text(encoding="utf-8").splitlines()) == 3
+    assert NewsStorage(str(tmp_path / "news_checks.json")).get_feedbacks() == records[-3:]
+
+
+def test_partially_written_line_is_skipped(tmp_path):
+    _storage_with_legacy_feedbacks(tmp_path, [_feedback(0)])
+    with open(tmp_path / storage.FEEDBACK_FILE_NAME, "ab") as f:
+        f.write(b'{"id": "feedback-1", "item')
+    store = NewsStorage(str(tmp_path / "news_checks.json"))
+    assert store.get_feedbacks() == [_feedback(0)]
+    # The next feedback starts on a line of its own instead of joining the torn one
+    record = store.add_feedback("item-2", "yorum 2")
+    assert store.get_feedbacks() == [_feedback(0), record]
+    assert NewsStorage(str(tmp_path / "news_checks.json")).get_feedbacks() == [_feedback(0), record]
+
+
+def test_concurrent_add_check_keeps_every_record(tmp_path):
+    store = _storage_with_legacy_feedbacks(tmp_path, [])
+
+    def add_checks(worker):
+        for i in range(40):
+            store.add_check({"item": {"id": f"check-{worker}-{i}", "link": "https://example.com/a"}, "verdict": "REAL"})
+
+    threads = [threading.Thread(target=add_checks, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    data = json.loads((tmp_path / "news_checks.json").read_text(encoding="utf-8"))
+    assert len(data["checks"]) == 320
+    assert len({c["id"] for c in data["checks"]}) == 320
+    assert data["url_counts"]["https://example.com/a"]["count"] == 320